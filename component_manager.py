@@ -4,21 +4,408 @@ Component Manager - Qt5 Interface for managing electronic components and categor
 """
 
 import sys
+import re
 import sqlite3
 import csv
+import io
+import time
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, wraps
+from itertools import chain, islice
+from operator import itemgetter
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QTabWidget, QLabel, QLineEdit, QPushButton, 
                            QTableWidget, QTableWidgetItem, QComboBox, QTextEdit,
                            QMessageBox, QHeaderView, QSplitter, QGroupBox,
                            QFormLayout, QDoubleSpinBox, QListWidget, QListWidgetItem,
                            QCheckBox, QSpacerItem, QSizePolicy, QFileDialog, QMenu, QInputDialog, QDialog,
-                           QCompleter, QAbstractItemView, QSpinBox, QRadioButton, QButtonGroup)
-from PyQt5.QtCore import Qt, pyqtSignal, QSortFilterProxyModel, QStringListModel
-from PyQt5.QtGui import QFont, QPalette, QColor
+                           QCompleter, QAbstractItemView, QSpinBox, QRadioButton, QButtonGroup,
+                           QTableView, QProgressDialog)
+from PyQt5.QtCore import (Qt, pyqtSignal, QSortFilterProxyModel, QStringListModel,
+                          QObject, QRunnable, QThreadPool, QTimer, QThread,
+                          QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QFont, QPalette, QColor, QBrush, QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import QAction
 
 
+# Export categories in report column order
+CATEGORIES = ('RESISTOR', 'CAPACITOR', 'DIODE', 'IC', 'TRANSISTORS', 'OTHER COMPONENTS')
+CATEGORY_INDEX = {category: i for i, category in enumerate(CATEGORIES)}
+
+# Reports always list at least this many item rows
+MIN_REPORT_ROWS = 10
+
+# Tab-delimited dialect used by the student report exports
+csv.register_dialect('tab_fast', delimiter='\t', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+
+# Number of students written between flushes in the all-students export
+EXPORT_FLUSH_INTERVAL = 50
+
+# Worker threads used to build the all-students export
+EXPORT_WORKERS = 4
+
+# Columns read by the component CSV import, with the value used when a column is absent
+IMPORT_COLUMNS = ('identifier', 'description', 'price', 'quantity', 'category')
+IMPORT_DEFAULTS = ['', '', '0', '0', 'OTHER COMPONENTS']
+
+# Most values bound in one IN (...) query, below SQLite's oldest variable limit of 999
+SQL_VARIABLE_LIMIT = 900
+
+# Read buffer for CSV imports, so large files are read in few system calls
+IMPORT_READ_BUFFER = 1 << 20
+
+# Rows processed between progress reports during a CSV import
+IMPORT_PROGRESS_INTERVAL = 500
+
+# Most DatabaseManager reads kept in the query cache, least recently used dropped first
+QUERY_CACHE_SIZE = 512
+
+# Seconds between checks for commits made by other connections or processes
+EXTERNAL_CHANGE_CHECK_INTERVAL = 1.0
+
+# Delay before writing changed settings, so rapid changes are saved once (ms)
+SETTINGS_SAVE_DELAY = 200
+
+# Delay before applying a search filter, so intermediate keystrokes are skipped (ms)
+SEARCH_FILTER_DELAY = 150
+
+# Application-wide Qt stylesheet, parsed once when main() installs it
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        border: none;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QTableView {
+        gridline-color: #cccccc;
+        background-color: white;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QTableView::item:selected {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border: 1px solid #cccccc;
+        border-bottom: none;
+    }
+    QTabBar::tab:selected {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QTabBar::tab:hover {
+        background-color: #45a049;
+        color: white;
+    }
+"""
+
+
+# Keyword patterns for categorize_component, checked in the order below against
+# "CODE\nDESCRIPTION" so each category needs a single scan ("^" anchors to the code)
+IC_PATTERN = re.compile('IC|LM|MC|OPAMP|OP-AMP|REGULATOR|DRIVER|BUFFER|INVERTER')
+RESISTOR_PATTERN = re.compile('RESISTOR|OHM|RES|^R_')
+CAPACITOR_PATTERN = re.compile('CAPACITOR|CAP|^C_')
+CAPACITOR_CODE_PATTERN = re.compile('UF|NF|PF')
+DIODE_PATTERN = re.compile('DIODE|^D_')
+TRANSISTOR_PATTERN = re.compile('TRANSISTOR|FET|IRF|^T_')
+
+# (category, pattern) rules used when grouping purchase history and report exports
+PURCHASE_CATEGORY_RULES = (
+    ('RESISTOR', re.compile('RESISTOR|OHM|R_')),
+    ('CAPACITOR', re.compile('CAPACITOR|CAP|UF|NF|PF|C_')),
+    ('DIODE', re.compile('DIODE|LED|D_')),
+    ('IC', re.compile('IC|LM|MC|U_')),
+    ('TRANSISTORS', re.compile('TRANSISTOR|FET|IRF|T_')),
+)
+REPORT_CATEGORY_RULES = (
+    ('RESISTOR', re.compile('RESISTOR|OHM|RES|R_')),
+    ('CAPACITOR', re.compile('CAPACITOR|CAP|UF|NF|PF|C_')),
+    ('DIODE', re.compile('DIODE|D_')),
+    ('IC', re.compile('IC|LM|MC|U_')),
+    ('TRANSISTORS', re.compile('TRANSISTOR|FET|IRF|T_')),
+)
+
+
+@lru_cache(maxsize=4096)
+def categorize_component(component_code, component_desc):
+    """Categorize component based on code and description"""
+    code_upper = (component_code or '').upper()
+    text = code_upper + '\n' + (component_desc or '').upper()
+    
+    # Special case: if component code looks like a capacitor value but might be misnamed
+    # Check if this should actually be a resistor based on other factors
+    if code_upper == "22NF":
+        # This specific case should be treated as a resistor based on expected output
+        return 'RESISTOR'
+    
+    # Special case: LED components should go to OTHER COMPONENTS, not DIODE
+    if "LED" in code_upper:
+        return 'OTHER COMPONENTS'
+    
+    # Special case: 74 series logic ICs should be categorized as IC
+    if code_upper.startswith('74'):
+        return 'IC'
+        
+    # Check for ICs first (before other patterns that might match)
+    if IC_PATTERN.search(text):
+        return 'IC'
+    
+    # Check for resistors
+    if RESISTOR_PATTERN.search(text):
+        return 'RESISTOR'
+        
+    # Check for capacitors - be more specific about patterns
+    if CAPACITOR_PATTERN.search(text) or CAPACITOR_CODE_PATTERN.search(code_upper):
+        return 'CAPACITOR'
+        
+    # Check for diodes
+    if DIODE_PATTERN.search(text):
+        return 'DIODE'
+        
+    # Check for transistors
+    if TRANSISTOR_PATTERN.search(text):
+        return 'TRANSISTORS'
+        
+    return 'OTHER COMPONENTS'
+
+
+@lru_cache(maxsize=4096)
+def categorize_by_keywords(rules, component_code, component_desc):
+    """Return the first category in rules whose pattern matches the code or description"""
+    text = (component_code or '').upper() + '\n' + (component_desc or '').upper()
+    
+    for category, pattern in rules:
+        if pattern.search(text):
+            return category
+    return 'OTHER COMPONENTS'
+
+
+# Component row in the column order of a freshly created components table; a tuple
+# subclass, so positional readers keep working and no per-record dict is allocated
+ComponentRecord = namedtuple('ComponentRecord', (
+    'id', 'identifier', 'description', 'price', 'quantity', 'category', 'created_at', 'updated_at'))
+
+COMPONENT_SELECT = ('SELECT id, identifier, description, price, quantity, category, created_at, updated_at '
+                    'FROM components')
+
+# Columns bound by component writes, in parameter order; the INSERT and UPDATE statements
+# below are generated from this once at import, so each is prepared once per connection
+COMPONENT_WRITE_COLUMNS = ('identifier', 'description', 'price', 'quantity', 'category', 'updated_at')
+COMPONENT_WRITE_PLACEHOLDERS = '(' + ', '.join('?' * len(COMPONENT_WRITE_COLUMNS)) + ')'
+SQL_INSERT_COMPONENT = (f"INSERT INTO components ({', '.join(COMPONENT_WRITE_COLUMNS)}) "
+                        f"VALUES {COMPONENT_WRITE_PLACEHOLDERS}")
+# Rows per multi-row INSERT, keeping the bound values per row under SQL_VARIABLE_LIMIT
+INSERT_BATCH_ROWS = SQL_VARIABLE_LIMIT // len(COMPONENT_WRITE_COLUMNS)
+SQL_INSERT_COMPONENT_BATCH = SQL_INSERT_COMPONENT + f', {COMPONENT_WRITE_PLACEHOLDERS}' * (INSERT_BATCH_ROWS - 1)
+SQL_UPDATE_COMPONENT = (f"UPDATE components SET {', '.join(c + ' = ?' for c in COMPONENT_WRITE_COLUMNS)} "
+                        f"WHERE id = ?")
+SQL_ADJUST_COMPONENT_STOCK = '''
+    UPDATE components
+    SET quantity = quantity + ?, updated_at = ?
+    WHERE id = ?
+'''
+
+
+def component_record(cursor, row):
+    """Row factory building a ComponentRecord with an interned identifier"""
+    return ComponentRecord(row[0], sys.intern(row[1]), *row[2:])
+
+
+@dataclass(frozen=True)
+class ColBlock:
+    """Columns of one category in a report layout"""
+    name: str
+    fields: tuple       # item record positions written for each item
+    empty: tuple        # cells written when the category has no item on a row
+    total_col: int      # position of the category total within its totals cells
+    total_width: int    # number of cells the category takes in the totals row
+
+
+# Report layouts in CATEGORIES order; item records are (value, quantity, price, total[, description])
+TAB_LAYOUT = tuple(ColBlock(category, (0, 1, 2, 3), ('', '', '', '0'), 3, 4) for category in CATEGORIES)
+CSV_LAYOUT = tuple(ColBlock(category, (1, 2, 3, 0), ('', '', '0', ''), 2, 4) for category in CATEGORIES[:4]) + (
+    ColBlock('TRANSISTORS', (1, 2, 3), ('', '', '0'), 2, 4),
+    ColBlock('OTHER COMPONENTS', (4, 0, 1, 2, 3), ('', '', '', '', '0'), 4, 5),
+)
+
+# Constant report header rows, built once at import
+TAB_CATEGORY_HEADER = tuple(cell for category in CATEGORIES for cell in (category, '', '', ''))
+TAB_SUBHEADER = ('Value', 'Quantity', 'Price', 'Total') * len(CATEGORIES)
+CSV_EMPTY_ROW = ('',) * 24
+CSV_CATEGORY_HEADER = (
+    'RESISTOR', '', '', 'CAPACITOR', '', '', '', 'DIODE', '', '', '', 'IC', 'S', '', '', '', 
+    'TRANSISTORS', '', '', '', 'OTHER COMPONENTS', '', '', ''
+)
+CSV_SUBHEADER = (
+    'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value', 
+    'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value',
+    'Quantity', 'Price', 'Total', 'Name', 'Value', 'Quantity', 'Price', 'Total'
+)
+
+
+def _build_bom_rows(layout, header_rows, groups):
+    """Build report rows from header rows and [items, total] groups laid out per layout"""
+    rows = list(header_rows)
+    
+    # Project each category's items to cell tuples in block column order in one C-level pass
+    slabs = [(list(map(itemgetter(*block.fields), items)), len(items), block.empty)
+             for block, (items, _) in zip(layout, groups)]
+    
+    # Pad every slab to the same length so data rows are a straight zip across categories
+    max_items = max(n for _, n, _ in slabs)
+    padded = [cells + [empty] * (max_items - n) for cells, n, empty in slabs]
+    rows += [tuple(chain.from_iterable(cells)) for cells in zip(*padded)]
+    
+    # Pad with empty rows so there are always at least MIN_REPORT_ROWS item rows
+    empty_row = sum((block.empty for block in layout), ())
+    rows += [empty_row] * (MIN_REPORT_ROWS - max_items)
+    
+    # Write totals row
+    totals = map('%.2f'.__mod__, [total for _, total in groups])
+    totals_row = []
+    for block, total in zip(layout, totals):
+        cells = [''] * block.total_width
+        cells[block.total_col] = total
+        totals_row += cells
+    rows.append(totals_row)
+    return rows
+
+
+def _write_bom(writer, layout, header_rows, groups):
+    """Write a report to a csv writer using the given column layout"""
+    writer.writerows(_build_bom_rows(layout, header_rows, groups))
+
+
+@lru_cache(maxsize=None)
+def _needs_quoting(dialect):
+    """Return a search function matching cell text the dialect would quote"""
+    d = csv.get_dialect(dialect)
+    return re.compile('[%s]' % re.escape(d.delimiter + d.quotechar + d.lineterminator + '\r\n')).search
+
+
+def render_csv(rows, dialect='excel'):
+    """Render rows to CSV text in memory"""
+    buf = io.StringIO()
+    writer = csv.writer(buf, dialect)
+    d = csv.get_dialect(dialect)
+    if d.quoting != csv.QUOTE_MINIMAL:
+        writer.writerows(rows)
+        return buf.getvalue()
+    
+    # Join rows that need no quoting directly; only the rest go through the csv module
+    needs_quoting = _needs_quoting(dialect)
+    delimiter = d.delimiter
+    lineterminator = d.lineterminator
+    for row in rows:
+        cells = ['' if value is None else str(value) for value in row]
+        if needs_quoting(''.join(cells)) or cells == ['']:
+            writer.writerow(row)
+        else:
+            buf.write(delimiter.join(cells) + lineterminator)
+    return buf.getvalue()
+
+
+def write_text_file(filename, text):
+    """Write rendered export text to disk in a single write"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_purchase_csv(filename, student_name, student_number, student_phone,
+                       initial_balance, used_amount, final_balance, groups):
+    """Write a purchase history report in the expected comma-separated format"""
+    header_rows = [
+        ['Student Name', student_name] + [''] * 22,
+        ['Student Number', student_number] + [''] * 22,
+        ['Contact', student_phone] + [''] * 22,
+        ['Paid', f"{initial_balance:.2f}"] + [''] * 22,
+        ['Used', f"{abs(used_amount):.2f}"] + [''] * 22,
+        ['Balance', f"{final_balance:.2f}"] + [''] * 22,
+        CSV_EMPTY_ROW,
+        CSV_CATEGORY_HEADER,
+        CSV_SUBHEADER,
+    ]
+    
+    write_text_file(filename, render_csv(_build_bom_rows(CSV_LAYOUT, header_rows, groups)))
+
+
+class ExportSignals(QObject):
+    """Signals emitted by a background export job"""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class ExportJob(QRunnable):
+    """Run a report writer on the global thread pool so the UI stays responsive"""
+    
+    def __init__(self, write_func, filename, *args):
+        super().__init__()
+        self.write_func = write_func
+        self.filename = filename
+        self.args = args
+        self.signals = ExportSignals()
+    
+    def run(self):
+        try:
+            self.write_func(self.filename, *self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filename)
+
+
+def start_export_job(jobs, on_finished, on_failed, write_func, filename, *args):
+    """Start an ExportJob, keeping it in jobs until it reports back"""
+    job = ExportJob(write_func, filename, *args)
+    job.setAutoDelete(False)
+    job.signals.finished.connect(on_finished)
+    job.signals.failed.connect(on_failed)
+    job.signals.finished.connect(lambda _: jobs.discard(job))
+    job.signals.failed.connect(lambda _: jobs.discard(job))
+    jobs.add(job)
+    QThreadPool.globalInstance().start(job)
+
+
 class SearchableComboBox(QComboBox):
     """A ComboBox with search functionality for students"""
     
@@ -77,18 +464,361 @@ class SearchableComboBox(QComboBox):
         self.completer.setModel(model)
 
 
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table model over a list of database records, queried only for visible cells"""
+    
+    HEADERS = ()
+    
+    # Text brushes built once and shared by every cell that uses them
+    RED_BRUSH = QBrush(QColor(255, 0, 0))
+    ORANGE_BRUSH = QBrush(QColor(255, 165, 0))
+    GREEN_BRUSH = QBrush(QColor(0, 128, 0))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+    
+    def set_records(self, records):
+        """Replace all records with a single model reset"""
+        self.beginResetModel()
+        self.records = list(records)
+        self.endResetModel()
+    
+    def record(self, row):
+        """Return the record shown in the given row"""
+        return self.records[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # Views ask for many roles per cell on every repaint, so answer the rest quickly
+        if role == Qt.DisplayRole:
+            return self.display_value(self.records[index.row()], index.column())
+        if role == Qt.ForegroundRole:
+            return self.foreground(self.records[index.row()], index.column())
+        return None
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort records by a column, keeping selections on the same records"""
+        self.layoutAboutToBeChanged.emit()
+        new_order = sorted(range(len(self.records)), key=lambda i: self.sort_key(self.records[i], column),
+                           reverse=order == Qt.DescendingOrder)
+        self.records = [self.records[i] for i in new_order]
+        
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_rows[index.row()], index.column()) for index in old_indexes])
+        self.layoutChanged.emit()
+    
+    def display_value(self, record, column):
+        """Text shown for a record's column"""
+        raise NotImplementedError
+    
+    def sort_key(self, record, column):
+        """Key used when sorting by a column; the display text by default"""
+        return self.display_value(record, column)
+    
+    def foreground(self, record, column):
+        """Text colour for a record's column, or None for the default"""
+        return None
+
+
+class ComponentTableModel(RecordTableModel):
+    """Table model over component records from get_components()"""
+    
+    HEADERS = ('ID', 'Identifier', 'Description', 'Price', 'Stock', 'Category')
+    
+    @staticmethod
+    def stock(component):
+        """Stock quantity of a component as an int"""
+        try:
+            return int(component[4]) if len(component) > 4 and component[4] is not None else 0
+        except (ValueError, TypeError):
+            return 0
+    
+    def display_value(self, component, column):
+        if column == 0:
+            return component[0]
+        if column == 1 or column == 2:
+            return str(component[column]) if component[column] is not None else ''
+        if column == 3:
+            return f"{component[3]:.2f}"
+        if column == 4:
+            return str(self.stock(component))
+        # Category column
+        category = component[5] if len(component) > 5 else 'OTHER COMPONENTS'
+        return category or ''
+    
+    def sort_key(self, component, column):
+        # ID, price and stock sort numerically
+        if column == 0 or column == 3:
+            return component[column]
+        if column == 4:
+            return self.stock(component)
+        return self.display_value(component, column)
+    
+    def foreground(self, component, column):
+        # Color code stock: red for negative (oversold), orange for zero, green for positive
+        if column == 4:
+            quantity = self.stock(component)
+            if quantity < 0:
+                return self.RED_BRUSH
+            elif quantity == 0:
+                return self.ORANGE_BRUSH
+            return self.GREEN_BRUSH
+        return None
+
+
+class PurchaseComponentTableModel(ComponentTableModel):
+    """Component table model for the purchase screen, without the category column"""
+    
+    HEADERS = ('ID', 'Component Code', 'Description', 'Price', 'Stock')
+
+
+class StudentTableModel(RecordTableModel):
+    """Table model over (student record, final balance) pairs"""
+    
+    HEADERS = ('ID', 'Name', 'Student Number', 'Email', 'Phone', 'Final Balance')
+    
+    def display_value(self, record, column):
+        student, final_balance = record
+        if column == 0:
+            return student[0]
+        if column == 5:
+            return f"{final_balance:.2f}"
+        if column == 4:
+            return str(student[5]) if student[5] is not None else ''
+        return student[column] or ''
+    
+    def sort_key(self, record, column):
+        # ID and balance sort numerically
+        if column == 0:
+            return record[0][0]
+        if column == 5:
+            return record[1]
+        return self.display_value(record, column)
+    
+    def foreground(self, record, column):
+        # Make text red for negative balance
+        if column == 5 and record[1] < 0:
+            return self.RED_BRUSH
+        return None
+
+
+class ReceiptTableModel(RecordTableModel):
+    """Table model over student transaction records from get_student_transactions()"""
+    
+    HEADERS = ('Date', 'Component Code', 'Qty', 'Unit Price', 'Total')
+    
+    def display_value(self, transaction, column):
+        if column == 0:
+            return transaction[6][:10] if transaction[6] else ''  # Just the date part
+        if column == 1:
+            return transaction[8] or ''  # component identifier
+        if column == 2:
+            return f"{transaction[3]:.1f}"
+        if column == 3:
+            return f"${transaction[4]:.2f}"
+        return f"${transaction[5]:.2f}"
+    
+    def sort_key(self, transaction, column):
+        # Quantity, unit price and total sort numerically
+        if column >= 2:
+            return transaction[column + 1]
+        return self.display_value(transaction, column)
+
+
+class RefreshWorker(QObject):
+    """Load the data shown by every tab into the DatabaseManager cache on a worker thread"""
+    finished = pyqtSignal()
+    
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+    
+    def run(self):
+        try:
+            self.db_manager.refresh_snapshot()
+        except Exception as e:
+            print(f"Error loading data: {e}")
+        finally:
+            self.db_manager.release_thread_connection()
+        self.finished.emit()
+
+
+class ImportWorker(QObject):
+    """Import a components CSV file on a worker thread"""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, db_manager, csv_file_path):
+        super().__init__()
+        self.db_manager = db_manager
+        self.csv_file_path = csv_file_path
+    
+    def run(self):
+        try:
+            results = self.db_manager.import_csv_components(self.csv_file_path, self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(results)
+        finally:
+            self.db_manager.release_thread_connection()
+
+
+# Threads and workers kept alive until their thread has stopped
+_running_workers = set()
+
+
+def start_worker_thread(worker, *done_signals):
+    """Run worker.run() on a new QThread that quits when any of done_signals is emitted"""
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    for signal in done_signals:
+        signal.connect(thread.quit)
+    entry = (thread, worker)
+    _running_workers.add(entry)
+    thread.finished.connect(lambda: _running_workers.discard(entry))
+    thread.start()
+    return thread
+
+
+def cached_query(*tables):
+    """Cache a DatabaseManager read until one of the given tables is changed, here or by another connection"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.check_external_changes()
+            # Take the versions before querying so a concurrent change is never cached as current
+            versions = tuple(self._table_versions[table] for table in tables)
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached is not None and cached[0] == versions:
+                    self._query_cache.move_to_end(key)
+                    return cached[1]
+            result = method(self, *args, **kwargs)
+            with self._query_cache_lock:
+                self._query_cache[key] = (versions, result)
+                self._query_cache.move_to_end(key)
+                if len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
+# Prepared statements kept per pooled connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Pragmas applied once to each pooled connection
+CONNECTION_PRAGMAS = (
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'cache_size=-64000',
+    'mmap_size=268435456',
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection kept open for reuse; close() rolls back uncommitted work instead of closing"""
+    
+    # Set while a caller holds a transaction open across several DatabaseManager calls
+    held = False
+    
+    def close(self):
+        if self.in_transaction and not self.held:
+            self.rollback()
+    
+    def release(self):
+        """Really close the connection"""
+        super().close()
+
+
 class DatabaseManager:
     """Handles all database operations"""
     
+    # Tables whose reads are cached, each with a version bumped whenever it changes
+    CACHED_TABLES = ('components', 'students', 'student_transactions', 'settings')
+    
     def __init__(self, db_path='components_users.db'):
         self.db_path = db_path
+        self._table_versions = dict.fromkeys(self.CACHED_TABLES, 0)
+        self._query_cache = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        # Dedicated connection polled for outside commits, with the last data_version it reported
+        self._version_conn = None
+        self._data_version = None
+        self._next_version_check = 0.0
+        self._local = threading.local()
+        # Open connections by owning thread, guarded by _connections_lock
+        self._connections = {}
+        self._connections_lock = threading.Lock()
         self.init_database()
     
+    def refresh_snapshot(self):
+        """Re-read everything the tabs show back-to-back in one read transaction, caching the results"""
+        # A manual refresh must show changes made outside this app, so nothing cached is reused
+        self.invalidate()
+        conn = self.get_connection()
+        conn.execute('BEGIN')
+        conn.held = True
+        try:
+            return {
+                'components': self.get_components(),
+                'students': self.get_students(),
+                'final_balances': self.get_student_final_balances(),
+                'settings': self._all_settings(),
+            }
+        finally:
+            conn.held = False
+            conn.rollback()
+    
+    def check_external_changes(self):
+        """Drop every cached read if another connection has committed, checking at most once per interval"""
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return
+        with self._query_cache_lock:
+            if now < self._next_version_check:
+                return
+            self._next_version_check = now + EXTERNAL_CHANGE_CHECK_INTERVAL
+            # data_version changes whenever any other connection commits, so one dedicated
+            # connection sees writes from every thread and process
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            data_version = self._version_conn.execute('PRAGMA data_version').fetchone()[0]
+            if data_version != self._data_version:
+                if self._data_version is not None:
+                    self.invalidate()
+                self._data_version = data_version
+    
+    def invalidate(self, *tables):
+        """Drop cached reads of the given tables (all tables if none given) after changing them"""
+        for table in tables or self.CACHED_TABLES:
+            self._table_versions[table] += 1
+    
     def init_database(self):
         """Initialize database with required tables"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # Write-ahead logging lets a batch commit with a single sync
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Create components table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS components (
@@ -158,62 +888,25 @@ class DatabaseManager:
             )
         ''')
         
+        # Index identifier lookups (not unique: duplicate identifiers are allowed)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_components_identifier ON components(identifier)')
+        
+        # Index transaction lookups by student and by component
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_transactions_student ON student_transactions(student_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_transactions_component ON student_transactions(component_id)')
+        
         conn.commit()
         conn.close()
     
     # Hardcoded categories - no longer stored in database
-    STANDARD_CATEGORIES = [
-        'RESISTOR',
-        'CAPACITOR', 
-        'DIODE',
-        'IC',
-        'TRANSISTORS',
-        'OTHER COMPONENTS'
-    ]
+    STANDARD_CATEGORIES = CATEGORIES
+    STANDARD_CATEGORIES_SET = frozenset(CATEGORIES)
     
     def categorize_component(self, component_code, component_desc):
         """Categorize component based on code and description"""
-        code_upper = (component_code or '').upper()
-        desc_upper = (component_desc or '').upper()
-        
-        # Special case: if component code looks like a capacitor value but might be misnamed
-        # Check if this should actually be a resistor based on other factors
-        if code_upper == "22NF":
-            # This specific case should be treated as a resistor based on expected output
-            return 'RESISTOR'
-        
-        # Special case: LED components should go to OTHER COMPONENTS, not DIODE
-        if "LED" in code_upper:
-            return 'OTHER COMPONENTS'
-        
-        # Special case: 74 series logic ICs should be categorized as IC
-        if code_upper.startswith('74'):
-            return 'IC'
-            
-        # Check for ICs first (before other patterns that might match)
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['IC', 'LM', 'MC', 'OPAMP', 'OP-AMP', 'REGULATOR', 'DRIVER', 'BUFFER', 'INVERTER']):
-            return 'IC'
-        
-        # Check for resistors
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['RESISTOR', 'OHM', 'RES']) or code_upper.startswith('R_'):
-            return 'RESISTOR'
-            
-        # Check for capacitors - be more specific about patterns
-        if (any(keyword in code_upper or keyword in desc_upper for keyword in ['CAPACITOR', 'CAP']) or 
-            any(pattern in code_upper for pattern in ['UF', 'NF', 'PF']) or 
-            code_upper.startswith('C_')):
-            return 'CAPACITOR'
-            
-        # Check for diodes
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['DIODE']) or code_upper.startswith('D_'):
-            return 'DIODE'
-            
-        # Check for transistors
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['TRANSISTOR', 'FET', 'IRF']) or code_upper.startswith('T_'):
-            return 'TRANSISTORS'
-            
-        return 'OTHER COMPONENTS'
+        return categorize_component(component_code, component_desc)
     
+    @cached_query('components')
     def get_component_category(self, component_id, component_code=None, component_desc=None):
         """Get component category from the component record"""
         conn = self.get_connection()
@@ -234,41 +927,106 @@ class DatabaseManager:
         return 'OTHER COMPONENTS'
     
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's database connection, opening and tuning it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only the owning thread uses it, but close() may release it from another
+            conn = sqlite3.connect(self.db_path, factory=PooledConnection, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(f'PRAGMA {pragma}')
+            # Rows index by position like tuples and also by column name
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self.release_finished_connections()
+            with self._connections_lock:
+                self._connections[threading.current_thread()] = conn
+        return conn
+    
+    def release_thread_connection(self):
+        """Close this thread's connection; workers call this before their thread ends"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            del self._local.conn
+            with self._connections_lock:
+                self._connections.pop(threading.current_thread(), None)
+            conn.release()
+    
+    def release_finished_connections(self):
+        """Close connections left behind by threads that have exited, such as export pool threads"""
+        with self._connections_lock:
+            finished = [thread for thread in self._connections if not thread.is_alive()]
+            conns = [self._connections.pop(thread) for thread in finished]
+        for conn in conns:
+            conn.release()
+    
+    def close(self):
+        """Close every connection opened by this manager"""
+        with self._connections_lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+        for conn in conns:
+            conn.release()
+        self._local = threading.local()
+        with self._query_cache_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+            self._version_conn = None
+            self._data_version = None
+            self._next_version_check = 0.0
+        # Outside changes are not tracked while closed
+        self.invalidate()
     
     def insert_component(self, identifier, description, price, quantity=0, category='OTHER COMPONENTS'):
         """Insert a new component with category"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO components (identifier, description, price, quantity, category, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (identifier, description, price, quantity, category, datetime.now().isoformat()))
-        
-        component_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_INSERT_COMPONENT,
+                           (identifier, description, price, quantity, category, datetime.now().isoformat()))
+            
+            component_id = cursor.lastrowid
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('components')
         return component_id
     
+    def insert_components_bulk(self, rows):
+        """Insert many components in one transaction; rows are (identifier, description, price[, quantity[, category]])"""
+        now = datetime.now().isoformat()
+        defaults = (0, 'OTHER COMPONENTS')
+        params = [(*row, *defaults[len(row) - 3:], now) for row in rows]
+        
+        conn = self.get_connection()
+        try:
+            with conn:
+                self._insert_component_rows(conn, params)
+        finally:
+            conn.close()
+            self.invalidate('components')
+        return len(params)
+    
     def insert_category(self, name, description):
         """Insert a new category"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO categories (name, description, updated_at)
-            VALUES (?, ?, ?)
-        ''', (name, description, datetime.now().isoformat()))
-        
-        category_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO categories (name, description, updated_at)
+                VALUES (?, ?, ?)
+            ''', (name, description, datetime.now().isoformat()))
+            
+            category_id = cursor.lastrowid
+            conn.commit()
+        finally:
+            conn.close()
         return category_id
     
     def link_component_category(self, component_id, category_id):
-        """Link a component to a category"""
+        """Link a component to a category; False if the link already exists"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -278,7 +1036,8 @@ class DatabaseManager:
                 VALUES (?, ?)
             ''', (component_id, category_id))
             conn.commit()
-            return True
+            # An ignored duplicate inserts no row
+            return cursor.rowcount == 1
         except sqlite3.Error:
             return False
         finally:
@@ -287,134 +1046,251 @@ class DatabaseManager:
     def unlink_component_category(self, component_id, category_id):
         """Unlink a component from a category"""
         conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                DELETE FROM component_category 
+                WHERE component_id = ? AND category_id = ?
+            ''', (component_id, category_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+    
+    @cached_query('components')
+    def get_components(self, limit=None, offset=0):
+        """Get all components, or a page of at most limit components starting at offset"""
+        conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = component_record
         
-        cursor.execute('''
-            DELETE FROM component_category 
-            WHERE component_id = ? AND category_id = ?
-        ''', (component_id, category_id))
-        
-        conn.commit()
+        if limit is None:
+            cursor.execute(f'{COMPONENT_SELECT} ORDER BY identifier')
+        else:
+            cursor.execute(f'{COMPONENT_SELECT} ORDER BY identifier LIMIT ? OFFSET ?', (limit, offset))
+        components = cursor.fetchall()
         conn.close()
+        return components
     
-    def get_components(self):
-        """Get all components"""
+    @cached_query('components')
+    def find_components_by_identifier_substring(self, substring):
+        """Get components whose identifier contains substring (case-insensitive for ASCII)"""
+        pattern = '%' + re.sub(r'([\\%_])', r'\\\1', substring) + '%'
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = component_record
         
-        cursor.execute('SELECT * FROM components ORDER BY identifier')
+        cursor.execute(f"{COMPONENT_SELECT} WHERE identifier LIKE ? ESCAPE '\\' ORDER BY identifier", (pattern,))
         components = cursor.fetchall()
         conn.close()
         return components
     
-    def update_component(self, component_id, identifier, description, price, quantity=None, category=None):
-        """Update an existing component"""
+    @cached_query('components')
+    def get_component_columns(self, *columns, limit=None, offset=0):
+        """Get only the named columns of all components (or a page of them), as plain tuples"""
+        unknown = set(columns) - set(ComponentRecord._fields)
+        if unknown:
+            raise ValueError(f"Unknown component columns: {', '.join(sorted(unknown))}")
+        
         conn = self.get_connection()
         cursor = conn.cursor()
-
-        if quantity is not None and category is not None:
-            cursor.execute('''
-                UPDATE components 
-                SET identifier = ?, description = ?, price = ?, quantity = ?, category = ?, updated_at = ?
-                WHERE id = ?
-            ''', (identifier, description, price, quantity, category, datetime.now().isoformat(), component_id))
-        elif quantity is not None:
-            cursor.execute('''
-                UPDATE components 
-                SET identifier = ?, description = ?, price = ?, quantity = ?, updated_at = ?
-                WHERE id = ?
-            ''', (identifier, description, price, quantity, datetime.now().isoformat(), component_id))
-        elif category is not None:
-            cursor.execute('''
-                UPDATE components 
-                SET identifier = ?, description = ?, price = ?, category = ?, updated_at = ?
-                WHERE id = ?
-            ''', (identifier, description, price, category, datetime.now().isoformat(), component_id))
-        else:
-            cursor.execute('''
-                UPDATE components 
-                SET identifier = ?, description = ?, price = ?, updated_at = ?
-                WHERE id = ?
-            ''', (identifier, description, price, datetime.now().isoformat(), component_id))
+        cursor.row_factory = None
         
-        conn.commit()
+        sql = f"SELECT {', '.join(columns)} FROM components ORDER BY identifier"
+        if limit is None:
+            cursor.execute(sql)
+        else:
+            cursor.execute(f'{sql} LIMIT ? OFFSET ?', (limit, offset))
+        rows = cursor.fetchall()
         conn.close()
+        return rows
     
-    def update_component_stock(self, component_id, quantity_change):
-        """Update component stock quantity (can go negative for tracking purposes)"""
+    @cached_query('components')
+    def count_components(self):
+        """Get the number of components"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            UPDATE components 
-            SET quantity = quantity + ?, updated_at = ?
-            WHERE id = ?
-        ''', (quantity_change, datetime.now().isoformat(), component_id))
-        
-        conn.commit()
+        cursor.execute('SELECT COUNT(*) FROM components')
+        count = cursor.fetchone()[0]
         conn.close()
+        return count
+    
+    def update_component(self, component_id, identifier, description, price, quantity=None, category=None):
+        """Update an existing component"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+
+            if quantity is not None and category is not None:
+                cursor.execute(SQL_UPDATE_COMPONENT,
+                               (identifier, description, price, quantity, category, datetime.now().isoformat(), component_id))
+            elif quantity is not None:
+                cursor.execute('''
+                    UPDATE components 
+                    SET identifier = ?, description = ?, price = ?, quantity = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (identifier, description, price, quantity, datetime.now().isoformat(), component_id))
+            elif category is not None:
+                cursor.execute('''
+                    UPDATE components 
+                    SET identifier = ?, description = ?, price = ?, category = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (identifier, description, price, category, datetime.now().isoformat(), component_id))
+            else:
+                cursor.execute('''
+                    UPDATE components 
+                    SET identifier = ?, description = ?, price = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (identifier, description, price, datetime.now().isoformat(), component_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('components')
+    
+    def update_component_stock(self, component_id, quantity_change):
+        """Update component stock quantity (can go negative for tracking purposes)"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute(SQL_ADJUST_COMPONENT_STOCK, (quantity_change, datetime.now().isoformat(), component_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('components')
     
     def update_category(self, category_id, name, description):
         """Update an existing category"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE categories 
-            SET name = ?, description = ?, updated_at = ?
-            WHERE id = ?
-        ''', (name, description, datetime.now().isoformat(), category_id))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE categories 
+                SET name = ?, description = ?, updated_at = ?
+                WHERE id = ?
+            ''', (name, description, datetime.now().isoformat(), category_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
     
     def delete_component(self, component_id):
         """Delete a component and its links"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Delete links first
-        cursor.execute('DELETE FROM component_category WHERE component_id = ?', (component_id,))
-        # Delete component
-        cursor.execute('DELETE FROM components WHERE id = ?', (component_id,))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Delete links first
+            cursor.execute('DELETE FROM component_category WHERE component_id = ?', (component_id,))
+            # Delete component
+            cursor.execute('DELETE FROM components WHERE id = ?', (component_id,))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('components')
     
     def delete_category(self, category_id):
         """Delete a category and its links"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Delete links first
-        cursor.execute('DELETE FROM component_category WHERE category_id = ?', (category_id,))
-        # Delete category
-        cursor.execute('DELETE FROM categories WHERE id = ?', (category_id,))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Delete links first
+            cursor.execute('DELETE FROM component_category WHERE category_id = ?', (category_id,))
+            # Delete category
+            cursor.execute('DELETE FROM categories WHERE id = ?', (category_id,))
+            
+            conn.commit()
+        finally:
+            conn.close()
     
+    @cached_query('components')
     def get_component_by_identifier(self, identifier):
         """Get component by identifier"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = component_record
         
-        cursor.execute('SELECT * FROM components WHERE identifier = ?', (identifier,))
+        cursor.execute(f'{COMPONENT_SELECT} WHERE identifier = ?', (identifier,))
         component = cursor.fetchone()
         conn.close()
         return component
     
+    @cached_query('components')
+    def has_identifier(self, identifier):
+        """Check whether any component uses identifier, answered from the identifier index alone"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT 1 FROM components WHERE identifier = ? LIMIT 1', (identifier,))
+        found = cursor.fetchone() is not None
+        conn.close()
+        return found
+    
+    def get_components_by_identifiers(self, identifiers):
+        """Get components for many identifiers at once, as {identifier: component} (lowest id wins)"""
+        identifiers = list(dict.fromkeys(identifiers))
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.row_factory = component_record
+        
+        components = {}
+        for start in range(0, len(identifiers), SQL_VARIABLE_LIMIT):
+            chunk = identifiers[start:start + SQL_VARIABLE_LIMIT]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(f'{COMPONENT_SELECT} WHERE identifier IN ({placeholders}) ORDER BY id', chunk)
+            for component in cursor.fetchall():
+                components.setdefault(component[1], component)
+        conn.close()
+        return components
+    
+    @cached_query('components')
     def get_component_by_id(self, component_id):
         """Get component by ID"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM components WHERE id = ?', (component_id,))
+        cursor.row_factory = component_record
+        cursor.execute(f'{COMPONENT_SELECT} WHERE id = ?', (component_id,))
         result = cursor.fetchone()
         conn.close()
         return result
     
-    def import_csv_components(self, csv_file_path):
-        """Import components from CSV file with duplicate handling"""
+    @staticmethod
+    def _insert_component_rows(conn, rows):
+        """Insert component rows chunk by chunk with multi-row INSERTs, the last partial chunk with executemany"""
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, INSERT_BATCH_ROWS))
+            if not chunk:
+                break
+            if len(chunk) == INSERT_BATCH_ROWS:
+                conn.execute(SQL_INSERT_COMPONENT_BATCH, list(chain.from_iterable(chunk)))
+            else:
+                conn.executemany(SQL_INSERT_COMPONENT, chunk)
+    
+    @staticmethod
+    def _execute_rows_individually(conn, sql, rows):
+        """Execute sql once per row inside savepoints, skipping rows that fail; returns the number skipped"""
+        failed = 0
+        for params in rows:
+            conn.execute('SAVEPOINT import_row')
+            try:
+                conn.execute(sql, params)
+            except sqlite3.Error as e:
+                print(f"Error importing row {params}: {e}")
+                conn.execute('ROLLBACK TO import_row')
+                failed += 1
+            conn.execute('RELEASE import_row')
+        return failed
+    
+    def import_csv_components(self, csv_file_path, progress_callback=None):
+        """Import components from CSV file with duplicate handling, reporting rows read to progress_callback"""
         import csv
         
         imported_count = 0
@@ -422,8 +1298,23 @@ class DatabaseManager:
         skipped_count = 0
         error_count = 0
         
+        # Existing components by identifier as [id, identifier, description, price, quantity, category],
+        # kept current in memory so later rows see earlier rows of the same file. Duplicates within
+        # the file collapse here, so each identifier is written at most once and no row queries SQLite
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT id, identifier, description, price, quantity, category FROM components ORDER BY id')
+        components = {}
+        for component in cursor.fetchall():
+            components.setdefault(sys.intern(component[1]), list(component))
+        conn.close()
+        
+        new_components = []       # entries to insert, in file order
+        updated_components = {}   # id -> existing entry to update
+        
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
+            encoding = self.detect_csv_encoding(csv_file_path)
+            with open(csv_file_path, 'r', newline='', encoding=encoding, buffering=IMPORT_READ_BUFFER) as file:
                 # Try to detect if file uses semicolon as delimiter
                 sample = file.read(1024)
                 file.seek(0)
@@ -432,16 +1323,27 @@ class DatabaseManager:
                 else:
                     delimiter = ','
                 
-                csv_reader = csv.DictReader(file, delimiter=delimiter)
+                # Stream rows as plain lists, locating columns by (case-insensitive) header name
+                csv_reader = csv.reader(file, delimiter=delimiter)
+                header = [name.strip().lower() for name in next(csv_reader, [])]
+                width = len(header)
+                # One C-level call picks all five columns out of a padded row
+                pick_columns = itemgetter(*(
+                    header.index(name) if name in header else width + i
+                    for i, name in enumerate(IMPORT_COLUMNS)))
+                strip = str.strip
                 
-                for row in csv_reader:
+                for row_count, row in enumerate(csv_reader, 1):
+                    if progress_callback and row_count % IMPORT_PROGRESS_INTERVAL == 0:
+                        progress_callback(row_count)
                     try:
+                        # Pad short rows, then append the defaults for absent columns
+                        fields = row[:width] + [''] * (width - len(row)) + IMPORT_DEFAULTS
+                        
                         # Clean and extract data using correct column names
-                        identifier = str(row.get('identifier', '')).strip()
-                        description = str(row.get('description', '')).strip()
-                        price_str = str(row.get('price', '0')).strip()
-                        quantity_str = str(row.get('quantity', '0')).strip()
-                        category = str(row.get('category', 'OTHER COMPONENTS')).strip()
+                        identifier, description, price_str, quantity_str, category = map(
+                            strip, pick_columns(fields))
+                        identifier = sys.intern(identifier)
 
                         # Skip empty rows
                         if not identifier:
@@ -458,43 +1360,26 @@ class DatabaseManager:
                             quantity = 0
 
                         # Check if component exists
-                        existing_component = self.get_component_by_identifier(identifier)
+                        existing_component = components.get(identifier)
 
                         if existing_component:
                             # Apply duplicate criteria only when component exists:
                             # 1. Higher price wins
                             # 2. If prices equal, prefer one with description
                             existing_price = existing_component[3]  # price column
-                            existing_desc = existing_component[2] or ''  # description column
-                            existing_quantity = existing_component[4] if len(existing_component) > 4 else 0
-                            existing_category = existing_component[5] if len(existing_component) > 5 else 'OTHER COMPONENTS'
-
-                            should_update = False
-
-                            if price > existing_price:
-                                should_update = True
-                            elif price == existing_price:
-                                if description and not existing_desc:
-                                    should_update = True
-                                elif not description and existing_desc:
-                                    should_update = False
-                                elif description and existing_desc:
-                                    should_update = False
-                                else:
-                                    should_update = False
-                            else:
-                                should_update = False
-
-                            if should_update:
-                                self.update_component(
-                                    existing_component[0], identifier, description, price, quantity, category
-                                )
+                            if price > existing_price or (
+                                    price == existing_price and description and not existing_component[2]):
+                                existing_component[2:] = [description, price, quantity, category]
+                                if existing_component[0] is not None:
+                                    updated_components[existing_component[0]] = existing_component
                                 updated_count += 1
                             else:
                                 skipped_count += 1
                         else:
                             # New component - add it regardless of whether it has description
-                            self.insert_component(identifier, description, price, quantity, category)
+                            new_component = [None, identifier, description, price, quantity, category]
+                            components[identifier] = new_component
+                            new_components.append(new_component)
                             imported_count += 1
 
                     except Exception as e:
@@ -505,6 +1390,47 @@ class DatabaseManager:
         except Exception as e:
             raise Exception(f"Failed to read CSV file: {e}")
         
+        # Write all inserts and updates in one transaction, taking the write lock up front
+        now = datetime.now().isoformat()
+        # Write new rows in identifier order and updates in id order, so the identifier index and
+        # the table B-tree are each filled in key order
+        new_components.sort(key=itemgetter(1))
+        updated_ids = sorted(updated_components)
+        
+        # Bind parameters are generated as each chunk is written rather than copied up front
+        def insert_rows():
+            return ((*component[1:], now) for component in new_components)
+        
+        def update_rows():
+            return ((*updated_components[component_id][1:], now, component_id) for component_id in updated_ids)
+        
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._insert_component_rows(conn, insert_rows())
+                conn.executemany(SQL_UPDATE_COMPONENT, update_rows())
+            except sqlite3.Error as e:
+                # A row was rejected: redo the batch row by row, dropping only the failing rows
+                print(f"Batch import failed ({e}), retrying row by row")
+                conn.rollback()
+                conn.execute('BEGIN IMMEDIATE')
+                failed_inserts = self._execute_rows_individually(conn, SQL_INSERT_COMPONENT, insert_rows())
+                failed_updates = self._execute_rows_individually(conn, SQL_UPDATE_COMPONENT, update_rows())
+                imported_count -= failed_inserts
+                updated_count -= failed_updates
+                error_count += failed_inserts + failed_updates
+            conn.commit()
+            
+            # Let SQLite refresh planner statistics after the bulk change
+            conn.execute('PRAGMA optimize')
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+            self.invalidate('components')
+        
         return {
             'imported': imported_count,
             'updated': updated_count,
@@ -512,45 +1438,63 @@ class DatabaseManager:
             'errors': error_count
         }
     
+    @staticmethod
+    def detect_csv_encoding(csv_file_path):
+        """Return 'utf-8-sig' if the file decodes as UTF-8 (with or without BOM), else 'latin-1'"""
+        try:
+            with open(csv_file_path, 'r', encoding='utf-8-sig') as file:
+                while file.read(1 << 16):
+                    pass
+            return 'utf-8-sig'
+        except UnicodeDecodeError:
+            return 'latin-1'
+    
     def insert_student(self, name, number, email, phone='', balance=0.0, initial_balance=None):
         """Insert a new student"""
         if initial_balance is None:
             initial_balance = balance
             
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO students (name, number, email, phone, balance, initial_balance, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (name, number, email, phone, balance, initial_balance, datetime.now().isoformat()))
-        
-        student_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO students (name, number, email, phone, balance, initial_balance, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (name, number, email, phone, balance, initial_balance, datetime.now().isoformat()))
+            
+            student_id = cursor.lastrowid
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('students')
         return student_id
     
     def update_student(self, student_id, name, number, email, phone='', balance=0.0, initial_balance=None):
         """Update an existing student"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        if initial_balance is not None:
-            cursor.execute('''
-                UPDATE students 
-                SET name = ?, number = ?, email = ?, phone = ?, balance = ?, initial_balance = ?, updated_at = ?
-                WHERE id = ?
-            ''', (name, number, email, phone, balance, initial_balance, datetime.now().isoformat(), student_id))
-        else:
-            cursor.execute('''
-                UPDATE students 
-                SET name = ?, number = ?, email = ?, phone = ?, balance = ?, updated_at = ?
-                WHERE id = ?
-            ''', (name, number, email, phone, balance, datetime.now().isoformat(), student_id))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            if initial_balance is not None:
+                cursor.execute('''
+                    UPDATE students 
+                    SET name = ?, number = ?, email = ?, phone = ?, balance = ?, initial_balance = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (name, number, email, phone, balance, initial_balance, datetime.now().isoformat(), student_id))
+            else:
+                cursor.execute('''
+                    UPDATE students 
+                    SET name = ?, number = ?, email = ?, phone = ?, balance = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (name, number, email, phone, balance, datetime.now().isoformat(), student_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('students')
     
+    @cached_query('students', 'student_transactions')
     def get_student_final_balance(self, student_id):
         """Get student's final balance (initial_balance - all transaction totals)"""
         conn = self.get_connection()
@@ -569,6 +1513,27 @@ class DatabaseManager:
         conn.close()
         return initial_balance - transactions_total
     
+    @cached_query('students', 'student_transactions')
+    def get_student_final_balances(self):
+        """Get every student's final balance in one query, as a student id: balance dict"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT s.id, s.initial_balance, COALESCE(t.total, 0.0)
+            FROM students s
+            LEFT JOIN (
+                SELECT student_id, SUM(total_cost) AS total
+                FROM student_transactions
+                GROUP BY student_id
+            ) t ON t.student_id = s.id
+        ''')
+        balances = {student_id: initial_balance - total for student_id, initial_balance, total in cursor.fetchall()}
+        
+        conn.close()
+        return balances
+    
+    @cached_query('students')
     def get_student_by_id(self, student_id):
         """Get student by ID including initial_balance"""
         conn = self.get_connection()
@@ -581,26 +1546,34 @@ class DatabaseManager:
     def delete_student(self, student_id):
         """Delete a student and their transactions"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Delete transactions first
-        cursor.execute('DELETE FROM student_transactions WHERE student_id = ?', (student_id,))
-        # Delete student
-        cursor.execute('DELETE FROM students WHERE id = ?', (student_id,))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Delete transactions first
+            cursor.execute('DELETE FROM student_transactions WHERE student_id = ?', (student_id,))
+            # Delete student
+            cursor.execute('DELETE FROM students WHERE id = ?', (student_id,))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('students', 'student_transactions')
     
-    def get_students(self):
-        """Get all students"""
+    @cached_query('students')
+    def get_students(self, limit=None, offset=0):
+        """Get all students, or a page of at most limit students starting at offset"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM students ORDER BY name')
+        if limit is None:
+            cursor.execute('SELECT * FROM students ORDER BY name')
+        else:
+            cursor.execute('SELECT * FROM students ORDER BY name LIMIT ? OFFSET ?', (limit, offset))
         students = cursor.fetchall()
         conn.close()
         return students
     
+    @cached_query('students')
     def get_student_by_number(self, number):
         """Get student by student number"""
         conn = self.get_connection()
@@ -614,81 +1587,120 @@ class DatabaseManager:
     def add_transaction(self, student_id, component_id, quantity, unit_price, notes=''):
         """Add a component purchase transaction for a student"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Check for existing transaction with same student_id, component_id, and unit_price
-        cursor.execute('''
-            SELECT id, quantity FROM student_transactions
-            WHERE student_id = ? AND component_id = ? AND unit_price = ?
-        ''', (student_id, component_id, unit_price))
-        existing = cursor.fetchone()
-
-        if existing:
-            transaction_id, existing_quantity = existing
-            new_quantity = existing_quantity + quantity
-            total_cost = new_quantity * unit_price
-            cursor.execute('''
-                UPDATE student_transactions
-                SET quantity = ?, total_cost = ?, notes = ?
-                WHERE id = ?
-            ''', (new_quantity, total_cost, notes, transaction_id))
-        else:
-            total_cost = quantity * unit_price
+        try:
+            cursor = conn.cursor()
+            
+            # Check for existing transaction with same student_id, component_id, and unit_price
             cursor.execute('''
-                INSERT INTO student_transactions 
-                (student_id, component_id, quantity, unit_price, total_cost, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (student_id, component_id, quantity, unit_price, total_cost, notes))
-            transaction_id = cursor.lastrowid
+                SELECT id, quantity FROM student_transactions
+                WHERE student_id = ? AND component_id = ? AND unit_price = ?
+            ''', (student_id, component_id, unit_price))
+            existing = cursor.fetchone()
 
-        # Update component stock (reduce by quantity purchased)
-        cursor.execute('''
-            UPDATE components
-            SET quantity = quantity - ?, updated_at = ?
-            WHERE id = ?
-        ''', (quantity, datetime.now().isoformat(), component_id))
+            if existing:
+                transaction_id, existing_quantity = existing
+                new_quantity = existing_quantity + quantity
+                total_cost = new_quantity * unit_price
+                cursor.execute('''
+                    UPDATE student_transactions
+                    SET quantity = ?, total_cost = ?, notes = ?
+                    WHERE id = ?
+                ''', (new_quantity, total_cost, notes, transaction_id))
+            else:
+                total_cost = quantity * unit_price
+                cursor.execute('''
+                    INSERT INTO student_transactions 
+                    (student_id, component_id, quantity, unit_price, total_cost, notes)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (student_id, component_id, quantity, unit_price, total_cost, notes))
+                transaction_id = cursor.lastrowid
 
-        conn.commit()
-        conn.close()
+            # Update component stock (reduce by quantity purchased)
+            cursor.execute(SQL_ADJUST_COMPONENT_STOCK, (-quantity, datetime.now().isoformat(), component_id))
+
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('student_transactions', 'components')
         return transaction_id
     
-    def get_setting(self, key, default_value=None):
-        """Get a setting value from the database"""
+    @cached_query('settings')
+    def _all_settings(self):
+        """Get every stored setting as a key: value dict"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = cursor.fetchone()
+        cursor.execute('SELECT key, value FROM settings')
+        settings = dict(cursor.fetchall())
         conn.close()
-        return result[0] if result else default_value
+        return settings
+    
+    def get_setting(self, key, default_value=None):
+        """Get a setting value from the database"""
+        return self._all_settings().get(key, default_value)
     
     def set_setting(self, key, value):
         """Set a setting value in the database"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO settings (key, value) 
-            VALUES (?, ?)
-        ''', (key, str(value)))
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO settings (key, value) 
+                VALUES (?, ?)
+            ''', (key, str(value)))
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('settings')
+    
+    def get_settings(self, defaults):
+        """Get several setting values at once, falling back to the given key: default dict"""
+        stored = self._all_settings()
+        return {key: stored.get(key, default) for key, default in defaults.items()}
+    
+    def set_settings(self, settings):
+        """Set several setting values in one transaction"""
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO settings (key, value) 
+                VALUES (?, ?)
+            ''', [(key, str(value)) for key, value in settings.items()])
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('settings')
     
-    def get_student_transactions(self, student_id):
-        """Get all transactions for a student"""
+    @cached_query('student_transactions', 'components')
+    def get_student_transactions(self, student_id, date_from=None, date_to=None):
+        """Get all transactions for a student, optionally within a YYYY-MM-DD date range"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
+        query = '''
             SELECT st.*, c.identifier, c.description 
             FROM student_transactions st
             JOIN components c ON st.component_id = c.id
             WHERE st.student_id = ?
-            ORDER BY st.transaction_date DESC
-        ''', (student_id,))
+        '''
+        params = [student_id]
+        
+        # Filter by date range in SQL (both bounds inclusive)
+        if date_from:
+            query += ' AND st.transaction_date >= ?'
+            params.append(date_from)
+        if date_to:
+            query += " AND st.transaction_date < date(?, '+1 day')"
+            params.append(date_to)
+        
+        query += ' ORDER BY st.transaction_date DESC'
+        cursor.execute(query, params)
         
         transactions = cursor.fetchall()
         conn.close()
         return transactions
     
+    @cached_query('student_transactions', 'students', 'components')
     def get_all_transactions(self):
         """Get all transactions with student and component details"""
         conn = self.get_connection()
@@ -710,27 +1722,30 @@ class DatabaseManager:
     def delete_transaction(self, transaction_id):
         """Delete a transaction and update student balance"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get transaction details first
-        cursor.execute('SELECT student_id, total_cost FROM student_transactions WHERE id = ?', (transaction_id,))
-        transaction = cursor.fetchone()
-        
-        if transaction:
-            student_id, total_cost = transaction
+        try:
+            cursor = conn.cursor()
             
-            # Delete transaction
-            cursor.execute('DELETE FROM student_transactions WHERE id = ?', (transaction_id,))
+            # Get transaction details first
+            cursor.execute('SELECT student_id, total_cost FROM student_transactions WHERE id = ?', (transaction_id,))
+            transaction = cursor.fetchone()
             
-            # Update student balance
-            cursor.execute('''
-                UPDATE students 
-                SET balance = balance - ?, updated_at = ?
-                WHERE id = ?
-            ''', (total_cost, datetime.now().isoformat(), student_id))
-        
-        conn.commit()
-        conn.close()
+            if transaction:
+                student_id, total_cost = transaction
+                
+                # Delete transaction
+                cursor.execute('DELETE FROM student_transactions WHERE id = ?', (transaction_id,))
+                
+                # Update student balance
+                cursor.execute('''
+                    UPDATE students 
+                    SET balance = balance - ?, updated_at = ?
+                    WHERE id = ?
+                ''', (total_cost, datetime.now().isoformat(), student_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate('student_transactions', 'students')
 
     def get_components_with_categories(self):
         """Get all components with their categories as comma-separated string"""
@@ -754,35 +1769,51 @@ class DatabaseManager:
     def add_component_category(self, component_id, category_id):
         """Add a category to a component"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Check if link already exists
-        cursor.execute('''
-            SELECT COUNT(*) FROM component_category 
-            WHERE component_id = ? AND category_id = ?
-        ''', (component_id, category_id))
-        
-        if cursor.fetchone()[0] == 0:
+        try:
+            cursor = conn.cursor()
+            
+            # Check if link already exists
             cursor.execute('''
-                INSERT INTO component_category (component_id, category_id)
-                VALUES (?, ?)
+                SELECT COUNT(*) FROM component_category 
+                WHERE component_id = ? AND category_id = ?
             ''', (component_id, category_id))
-        
-        conn.commit()
-        conn.close()
+            
+            if cursor.fetchone()[0] == 0:
+                cursor.execute('''
+                    INSERT INTO component_category (component_id, category_id)
+                    VALUES (?, ?)
+                ''', (component_id, category_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
 
     def remove_component_category(self, component_id, category_id):
         """Remove a category from a component"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            DELETE FROM component_category 
-            WHERE component_id = ? AND category_id = ?
-        ''', (component_id, category_id))
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                DELETE FROM component_category 
+                WHERE component_id = ? AND category_id = ?
+            ''', (component_id, category_id))
+            
+            conn.commit()
+        finally:
+            conn.close()
+
+
+# DatabaseManager instances shared by get_db(), one per database file
+_db_managers = {}
+
+
+def get_db(db_path='components_users.db'):
+    """Return the shared DatabaseManager for a database file, creating it on first use"""
+    db_manager = _db_managers.get(db_path)
+    if db_manager is None:
+        db_manager = _db_managers[db_path] = DatabaseManager(db_path)
+    return db_manager
 
 
 class ComponentWidget(QWidget):
@@ -868,9 +1899,10 @@ class ComponentWidget(QWidget):
         
         table_layout.addLayout(search_layout)
         
-        self.components_table = QTableWidget()
-        self.components_table.setColumnCount(6)  # Updated to include category column
-        self.components_table.setHorizontalHeaderLabels(['ID', 'Identifier', 'Description', 'Price', 'Stock', 'Category'])
+        self.components_model = ComponentTableModel(self)
+        self.components_table = QTableView()
+        self.components_table.setModel(self.components_model)
+        self.components_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Enable sorting
         self.components_table.setSortingEnabled(True)
@@ -887,11 +1919,11 @@ class ComponentWidget(QWidget):
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Stock - fit content
         
         # Set selection behavior
-        self.components_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.components_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.components_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.components_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         # Connect signals
-        self.components_table.itemClicked.connect(self.on_component_selected)
+        self.components_table.clicked.connect(self.on_component_selected)
         self.components_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.components_table.customContextMenuRequested.connect(self.show_context_menu)
         
@@ -942,52 +1974,10 @@ class ComponentWidget(QWidget):
     
     def display_components(self, components):
         """Display the given list of components in the table"""
-        # Temporarily disable sorting to prevent visual issues during table update
-        self.components_table.setSortingEnabled(False)
-        
-        self.components_table.setRowCount(len(components))
-        
-        for row, component in enumerate(components):
-            # Create ID item with numeric sorting
-            id_item = QTableWidgetItem()
-            id_item.setData(Qt.DisplayRole, component[0])  # Set as integer for proper sorting
-            self.components_table.setItem(row, 0, id_item)
-
-            self.components_table.setItem(row, 1, QTableWidgetItem(str(component[1]) if component[1] is not None else ''))      # Identifier
-            self.components_table.setItem(row, 2, QTableWidgetItem(str(component[2]) if component[2] is not None else '')) # Description
-
-            # Create price item with numeric sorting
-            price_item = QTableWidgetItem()
-            price_item.setData(Qt.DisplayRole, component[3])  # Set as float for proper sorting
-            price_item.setText(f"{component[3]:.2f}")  # Display formatted text
-            self.components_table.setItem(row, 3, price_item)
-
-            # Create quantity item with numeric sorting and color coding
-            quantity_item = QTableWidgetItem()
-            try:
-                quantity = int(component[4]) if len(component) > 4 and component[4] is not None else 0
-            except (ValueError, TypeError):
-                quantity = 0
-            quantity_item.setData(Qt.DisplayRole, quantity)
-            quantity_item.setText(str(quantity))
-
-            # Color code negative quantities (oversold items)
-            if quantity < 0:
-                quantity_item.setForeground(QColor(255, 0, 0))  # Red for negative
-            elif quantity == 0:
-                quantity_item.setForeground(QColor(255, 165, 0))  # Orange for zero stock
-            else:
-                quantity_item.setForeground(QColor(0, 128, 0))  # Green for positive stock
-
-            self.components_table.setItem(row, 4, quantity_item)
-
-            # Category column
-            category = component[5] if len(component) > 5 else 'OTHER COMPONENTS'
-            self.components_table.setItem(row, 5, QTableWidgetItem(category))
+        self.components_model.set_records(components)
         
-        # Re-enable sorting and sort by ID column numerically
-        self.components_table.setSortingEnabled(True)
-        self.components_table.sortItems(0, Qt.AscendingOrder)
+        # Sort by ID column numerically
+        self.components_table.sortByColumn(0, Qt.AscendingOrder)
     
     def add_component(self):
         identifier = self.identifier_edit.text().strip()
@@ -1060,8 +2050,7 @@ class ComponentWidget(QWidget):
     
     def show_context_menu(self, position):
         """Show context menu for table items"""
-        item = self.components_table.itemAt(position)
-        if item is None:
+        if not self.components_table.indexAt(position).isValid():
             return
         
         # Create context menu
@@ -1083,15 +2072,16 @@ class ComponentWidget(QWidget):
     
     def edit_selected_component(self):
         """Edit the currently selected component"""
-        current_row = self.components_table.currentRow()
+        current_row = self.components_table.currentIndex().row()
         if current_row < 0:
             return
         
         # Get component data from table
-        component_id = int(self.components_table.item(current_row, 0).text())
-        identifier = self.components_table.item(current_row, 1).text()
-        description = self.components_table.item(current_row, 2).text()
-        price = float(self.components_table.item(current_row, 3).text())
+        component = self.components_model.record(current_row)
+        component_id = component[0]
+        identifier = self.components_model.display_value(component, 1)
+        description = self.components_model.display_value(component, 2)
+        price = component[3]
         
         # Populate form fields
         self.selected_component_id = component_id
@@ -1127,12 +2117,13 @@ class ComponentWidget(QWidget):
     
     def delete_selected_component(self):
         """Delete the currently selected component"""
-        current_row = self.components_table.currentRow()
+        current_row = self.components_table.currentIndex().row()
         if current_row < 0:
             return
         
-        component_id = int(self.components_table.item(current_row, 0).text())
-        identifier = self.components_table.item(current_row, 1).text()
+        component = self.components_model.record(current_row)
+        component_id = component[0]
+        identifier = self.components_model.display_value(component, 1)
         
         reply = QMessageBox.question(
             self, 
@@ -1152,13 +2143,13 @@ class ComponentWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete component: {str(e)}")
     
-    def on_component_selected(self, item):
-        row = item.row()
-        component_id = int(self.components_table.item(row, 0).text())
-        identifier = self.components_table.item(row, 1).text()
-        description = self.components_table.item(row, 2).text()
-        price = float(self.components_table.item(row, 3).text())
-        quantity = int(self.components_table.item(row, 4).text())
+    def on_component_selected(self, index):
+        component = self.components_model.record(index.row())
+        component_id = component[0]
+        identifier = self.components_model.display_value(component, 1)
+        description = self.components_model.display_value(component, 2)
+        price = component[3]
+        quantity = ComponentTableModel.stock(component)
         
         self.selected_component_id = component_id
         self.identifier_edit.setText(identifier)
@@ -1223,9 +2214,45 @@ class ComponentWidget(QWidget):
             if reply != QMessageBox.Yes:
                 return
             
-            # Perform import
-            results = self.db_manager.import_csv_components(file_path)
+            # Perform import on a worker thread, showing progress meanwhile
+            self.import_button.setEnabled(False)
+            self.import_progress = QProgressDialog("Importing components...", None, 0, 0, self)
+            self.import_progress.setWindowTitle("Import CSV")
+            self.import_progress.setWindowModality(Qt.WindowModal)
+            self.import_progress.setMinimumDuration(0)
+            self.import_progress.show()
+            self.import_started = time.monotonic()
+            
+            self.import_worker = ImportWorker(self.db_manager, file_path)
+            self.import_worker.progress.connect(self.on_import_progress)
+            self.import_worker.finished.connect(self.on_import_finished)
+            self.import_worker.failed.connect(self.on_import_failed)
+            start_worker_thread(
+                self.import_worker, self.import_worker.finished, self.import_worker.failed)
             
+        except Exception as e:
+            QMessageBox.critical(self, "Import Error", f"Failed to import CSV file:\n{str(e)}")
+    
+    def on_import_progress(self, rows):
+        """Show rows read so far and the import rate"""
+        elapsed = time.monotonic() - self.import_started
+        rate = rows / elapsed if elapsed > 0 else 0
+        self.import_progress.setLabelText(f"Importing components...\n{rows} rows read ({rate:.0f} rows/s)")
+    
+    def end_import(self):
+        """Close the progress dialog and re-enable importing"""
+        self.import_progress.close()
+        self.import_button.setEnabled(True)
+    
+    def on_import_failed(self, error):
+        """Report a failed CSV import"""
+        self.end_import()
+        QMessageBox.critical(self, "Import Error", f"Failed to import CSV file:\n{error}")
+    
+    def on_import_finished(self, results):
+        """Show CSV import results and refresh the table"""
+        self.end_import()
+        try:
             # Show results
             message = f"CSV Import Complete!\n\n"
             message += f"• New components imported: {results['imported']}\n"
@@ -1321,9 +2348,10 @@ class StudentWidget(QWidget):
         
         table_layout.addLayout(search_layout)
         
-        self.students_table = QTableWidget()
-        self.students_table.setColumnCount(6)
-        self.students_table.setHorizontalHeaderLabels(['ID', 'Name', 'Student Number', 'Email', 'Phone', 'Final Balance'])
+        self.students_model = StudentTableModel(self)
+        self.students_table = QTableView()
+        self.students_table.setModel(self.students_model)
+        self.students_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Enable sorting
         self.students_table.setSortingEnabled(True)
@@ -1339,11 +2367,11 @@ class StudentWidget(QWidget):
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents) # Balance
         
         # Set selection behavior
-        self.students_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.students_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.students_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.students_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         # Connect signals
-        self.students_table.itemClicked.connect(self.on_student_selected)
+        self.students_table.clicked.connect(self.on_student_selected)
         self.students_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.students_table.customContextMenuRequested.connect(self.show_context_menu)
         
@@ -1360,8 +2388,9 @@ class StudentWidget(QWidget):
         # Initial state
         self.delete_button.setEnabled(False)
         
-        # Store all students for filtering
+        # Store all students and their final balances for filtering
         self.all_students = []
+        self.final_balances = {}
     
     def auto_update_email(self, text):
         """Auto-append @nust.na to student number for email"""
@@ -1439,13 +2468,13 @@ class StudentWidget(QWidget):
         self.delete_button.setEnabled(False)
         self.add_button.setText("Add Student")
     
-    def on_student_selected(self, item):
-        row = item.row()
-        student_id = int(self.students_table.item(row, 0).text())
-        name = self.students_table.item(row, 1).text()
-        number = self.students_table.item(row, 2).text()
-        email = self.students_table.item(row, 3).text()
-        phone = self.students_table.item(row, 4).text()
+    def on_student_selected(self, index):
+        record = self.students_model.record(index.row())
+        student_id = record[0][0]
+        name = self.students_model.display_value(record, 1)
+        number = self.students_model.display_value(record, 2)
+        email = self.students_model.display_value(record, 3)
+        phone = self.students_model.display_value(record, 4)
         
         # Get the initial balance from the database
         student_data = self.db_manager.get_student_by_id(student_id)
@@ -1469,8 +2498,7 @@ class StudentWidget(QWidget):
     
     def show_context_menu(self, position):
         """Show context menu for table items"""
-        item = self.students_table.itemAt(position)
-        if item is None:
+        if not self.students_table.indexAt(position).isValid():
             return
         
         context_menu = QMenu(self)
@@ -1487,13 +2515,12 @@ class StudentWidget(QWidget):
     
     def edit_selected_student(self):
         """Edit the currently selected student"""
-        current_row = self.students_table.currentRow()
-        if current_row < 0:
+        current_index = self.students_table.currentIndex()
+        if not current_index.isValid():
             return
         
         # Trigger the selection handler
-        item = self.students_table.item(current_row, 0)
-        self.on_student_selected(item)
+        self.on_student_selected(current_index)
         
         if self.db_manager.get_setting('show_info_popups', 'false') == 'true':
             QMessageBox.information(
@@ -1504,12 +2531,13 @@ class StudentWidget(QWidget):
     
     def delete_selected_student(self):
         """Delete the currently selected student"""
-        current_row = self.students_table.currentRow()
+        current_row = self.students_table.currentIndex().row()
         if current_row < 0:
             return
         
-        student_id = int(self.students_table.item(current_row, 0).text())
-        name = self.students_table.item(current_row, 1).text()
+        record = self.students_model.record(current_row)
+        student_id = record[0][0]
+        name = self.students_model.display_value(record, 1)
         
         self.selected_student_id = student_id
         
@@ -1553,42 +2581,22 @@ class StudentWidget(QWidget):
     
     def display_students(self, students):
         """Display the given list of students in the table"""
-        # Temporarily disable sorting to prevent visual issues during table update
-        self.students_table.setSortingEnabled(False)
-        
-        self.students_table.setRowCount(len(students))
-        
-        for row, student in enumerate(students):
-            # ID
-            id_item = QTableWidgetItem()
-            id_item.setData(Qt.DisplayRole, student[0])
-            self.students_table.setItem(row, 0, id_item)
-            
-            # Name, Number, Email, Phone
-            self.students_table.setItem(row, 1, QTableWidgetItem(student[1]))
-            self.students_table.setItem(row, 2, QTableWidgetItem(student[2] or ''))
-            self.students_table.setItem(row, 3, QTableWidgetItem(student[3] or ''))
-            self.students_table.setItem(row, 4, QTableWidgetItem(str(student[5]) if student[5] is not None else ''))
-            
-            # Final Balance (calculated from initial_balance + transactions)
-            final_balance = self.db_manager.get_student_final_balance(student[0])
-            balance_item = QTableWidgetItem()
-            balance_item.setData(Qt.DisplayRole, final_balance)
-            balance_item.setText(f"{final_balance:.2f}")
-            
-            # Make text red for negative balance
-            if final_balance < 0:
-                balance_item.setForeground(QColor(255, 0, 0))  # Red color
-            
-            self.students_table.setItem(row, 5, balance_item)
+        # Final Balance (calculated from initial_balance + transactions)
+        records = []
+        for student in students:
+            final_balance = self.final_balances.get(student[0])
+            if final_balance is None:
+                final_balance = self.db_manager.get_student_final_balance(student[0])
+            records.append((student, final_balance))
+        self.students_model.set_records(records)
         
-        # Re-enable sorting and sort by ID column numerically
-        self.students_table.setSortingEnabled(True)
-        self.students_table.sortItems(0, Qt.AscendingOrder)
+        # Sort by ID column numerically
+        self.students_table.sortByColumn(0, Qt.AscendingOrder)
     
     def refresh_students(self):
-        """Refresh the students list from database"""
+        """Refresh the students list and final balances from database"""
         self.all_students = self.db_manager.get_students()
+        self.final_balances = self.db_manager.get_student_final_balances()
         self.filter_students()
 
 
@@ -1718,8 +2726,7 @@ class AddComponentDialog(QDialog):
             return
         
         # Check if component already exists
-        existing_component = self.db_manager.get_component_by_identifier(identifier)
-        if existing_component:
+        if self.db_manager.has_identifier(identifier):
             QMessageBox.warning(
                 self, 
                 "Duplicate Component", 
@@ -1765,6 +2772,7 @@ class StudentReceiptsWidget(QWidget):
         super().__init__()
         self.db_manager = db_manager
         self.current_student_id = None
+        self.export_jobs = set()
         self.init_ui()
         self.refresh_data()
     
@@ -1809,9 +2817,10 @@ class StudentReceiptsWidget(QWidget):
         left_layout.addLayout(search_layout)
         
         # Components table
-        self.transaction_components_table = QTableWidget()
-        self.transaction_components_table.setColumnCount(5)  # Updated to include quantity column
-        self.transaction_components_table.setHorizontalHeaderLabels(['ID', 'Component Code', 'Description', 'Price', 'Stock'])
+        self.transaction_components_model = PurchaseComponentTableModel(self)
+        self.transaction_components_table = QTableView()
+        self.transaction_components_table.setModel(self.transaction_components_model)
+        self.transaction_components_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Set column widths
         header = self.transaction_components_table.horizontalHeader()
@@ -1823,9 +2832,9 @@ class StudentReceiptsWidget(QWidget):
         
         # Enable sorting and selection
         self.transaction_components_table.setSortingEnabled(True)
-        self.transaction_components_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.transaction_components_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.transaction_components_table.itemDoubleClicked.connect(self.add_single_purchase)
+        self.transaction_components_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.transaction_components_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.transaction_components_table.doubleClicked.connect(self.add_single_purchase)
         
         left_layout.addWidget(self.transaction_components_table)
         
@@ -1855,7 +2864,7 @@ class StudentReceiptsWidget(QWidget):
         left_layout.addLayout(add_controls_layout)
         
         # Connect selection change
-        self.transaction_components_table.itemSelectionChanged.connect(self.on_component_selection_changed)
+        self.transaction_components_table.selectionModel().selectionChanged.connect(self.on_component_selection_changed)
         
         splitter.addWidget(left_widget)
         
@@ -1864,9 +2873,10 @@ class StudentReceiptsWidget(QWidget):
         right_layout = QVBoxLayout(right_widget)
         
         # Receipt table (showing all transactions for selected student)
-        self.receipt_table = QTableWidget()
-        self.receipt_table.setColumnCount(5)
-        self.receipt_table.setHorizontalHeaderLabels(['Date', 'Component Code', 'Qty', 'Unit Price', 'Total'])
+        self.receipt_model = ReceiptTableModel(self)
+        self.receipt_table = QTableView()
+        self.receipt_table.setModel(self.receipt_model)
+        self.receipt_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Set column widths for receipt
         receipt_header = self.receipt_table.horizontalHeader()
@@ -1877,8 +2887,8 @@ class StudentReceiptsWidget(QWidget):
         receipt_header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Total
         
         # Enable selection and sorting for receipt
-        self.receipt_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.receipt_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.receipt_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.receipt_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.receipt_table.setSortingEnabled(True)
         
         # Context menu for receipt history
@@ -2017,52 +3027,10 @@ class StudentReceiptsWidget(QWidget):
     
     def display_components(self, components):
         """Display the given list of components in the table"""
-        # Temporarily disable sorting to prevent visual issues during table update
-        self.transaction_components_table.setSortingEnabled(False)
-        
-        self.transaction_components_table.setRowCount(len(components))
-        
-        for row, component in enumerate(components):
-            # Create ID item with numeric sorting
-            id_item = QTableWidgetItem()
-            id_item.setData(Qt.DisplayRole, component[0])  # Set as integer for proper sorting
-            self.transaction_components_table.setItem(row, 0, id_item)
-
-            self.transaction_components_table.setItem(row, 1, QTableWidgetItem(str(component[1]) if component[1] is not None else ''))      # Identifier
-            self.transaction_components_table.setItem(row, 2, QTableWidgetItem(str(component[2]) if component[2] is not None else '')) # Description
-
-            # Create price item with numeric sorting
-            price_item = QTableWidgetItem()
-            price_item.setData(Qt.DisplayRole, component[3])  # Set as float for proper sorting
-            price_item.setText(f"{component[3]:.2f}")  # Display formatted text
-            self.transaction_components_table.setItem(row, 3, price_item)
-
-            # Create quantity item with numeric sorting and color coding
-            quantity_item = QTableWidgetItem()
-            try:
-                quantity = int(component[4]) if len(component) > 4 and component[4] is not None else 0
-            except (ValueError, TypeError):
-                quantity = 0
-            quantity_item.setData(Qt.DisplayRole, quantity)
-            quantity_item.setText(str(quantity))
-
-            # Color code negative quantities (oversold items)
-            if quantity < 0:
-                quantity_item.setForeground(QColor(255, 0, 0))  # Red for negative
-            elif quantity == 0:
-                quantity_item.setForeground(QColor(255, 165, 0))  # Orange for zero stock
-            else:
-                quantity_item.setForeground(QColor(0, 128, 0))  # Green for positive stock
-
-            self.transaction_components_table.setItem(row, 4, quantity_item)
-
-            # Category column
-            category = component[5] if len(component) > 5 else 'OTHER COMPONENTS'
-            self.transaction_components_table.setItem(row, 5, QTableWidgetItem(category))
+        self.transaction_components_model.set_records(components)
         
-        # Re-enable sorting and sort by ID column numerically
-        self.transaction_components_table.setSortingEnabled(True)
-        self.transaction_components_table.sortItems(0, Qt.AscendingOrder)
+        # Sort by ID column numerically
+        self.transaction_components_table.sortByColumn(0, Qt.AscendingOrder)
     
     def on_component_selection_changed(self):
         """Enable/disable add button based on selection"""
@@ -2070,7 +3038,7 @@ class StudentReceiptsWidget(QWidget):
     
     def update_button_states(self):
         """Update button states based on current selections"""
-        has_component_selection = self.transaction_components_table.currentRow() >= 0
+        has_component_selection = self.transaction_components_table.currentIndex().isValid()
         has_student = self.current_student_id is not None
         self.add_component_btn.setEnabled(has_component_selection and has_student)
         
@@ -2079,16 +3047,17 @@ class StudentReceiptsWidget(QWidget):
     
     def add_single_purchase(self):
         """Add a single component purchase to the student's history"""
-        current_row = self.transaction_components_table.currentRow()
+        current_row = self.transaction_components_table.currentIndex().row()
         if current_row < 0 or not self.current_student_id:
             print(f"[DEBUG] No component selected or no student selected. current_row={current_row}, current_student_id={self.current_student_id}")
             return
         
-        # Get component details
-        component_id = int(self.transaction_components_table.item(current_row, 0).text())
-        component_code = self.transaction_components_table.item(current_row, 1).text()
-        description = self.transaction_components_table.item(current_row, 2).text()
-        unit_price = float(self.transaction_components_table.item(current_row, 3).text().replace('$', ''))
+        # Get component details, charging the price as displayed
+        component = self.transaction_components_model.record(current_row)
+        component_id = component[0]
+        component_code = self.transaction_components_model.display_value(component, 1)
+        description = self.transaction_components_model.display_value(component, 2)
+        unit_price = float(self.transaction_components_model.display_value(component, 3))
         quantity = self.quantity_spin.value()
         print(f"[DEBUG] Selected component_id={component_id}, component_code={component_code}, description={description}, unit_price={unit_price}, quantity={quantity}")
 
@@ -2182,15 +3151,8 @@ class StudentReceiptsWidget(QWidget):
             # Get student transactions
             transactions = self.db_manager.get_student_transactions(self.current_student_id)
             
-            # Group transactions by component category
-            component_groups = {
-                'RESISTOR': {'items': [], 'total': 0},
-                'CAPACITOR': {'items': [], 'total': 0}, 
-                'DIODE': {'items': [], 'total': 0},
-                'IC': {'items': [], 'total': 0},
-                'TRANSISTORS': {'items': [], 'total': 0},
-                'OTHER COMPONENTS': {'items': [], 'total': 0}
-            }
+            # Group transactions by component category as [items, total] in CATEGORIES order
+            groups = [[[], 0] for _ in CATEGORIES]
             
             # Process each transaction
             for transaction in transactions:
@@ -2208,16 +3170,11 @@ class StudentReceiptsWidget(QWidget):
                     # Determine category based on component code/description
                     category = self.categorize_component(component_code, component_desc)
                     
-                    item = {
-                        'quantity': abs(quantity),  # Use absolute value for display
-                        'price': unit_price,
-                        'total': abs(total_cost),   # Use absolute value for display
-                        'value': component_code,
-                        'description': component_desc
-                    }
-                    
-                    component_groups[category]['items'].append(item)
-                    component_groups[category]['total'] += abs(total_cost)
+                    # (value, quantity, price, total, description) using absolute values for display
+                    total_abs = abs(total_cost)
+                    group = groups[CATEGORY_INDEX[category]]
+                    group[0].append((component_code, abs(quantity), unit_price, total_abs, component_desc))
+                    group[1] += total_abs
             
             # Ask user for save location
             filename, _ = QFileDialog.getSaveFileName(
@@ -2228,14 +3185,12 @@ class StudentReceiptsWidget(QWidget):
             )
             
             if filename:
-                self.write_csv_file(filename, student_name, student_number, student_phone, 
-                                  initial_balance, used_amount, final_balance, component_groups)
-                
-                QMessageBox.information(
-                    self,
-                    "Export Successful",
-                    f"Purchase history exported to:\n{filename}"
-                )
+                # Write the file in the background; the data above was read on this thread
+                self.add_single_purchase_btn.setEnabled(False)
+                start_export_job(self.export_jobs, self.on_purchase_export_finished,
+                                 self.on_purchase_export_failed, write_purchase_csv,
+                                 filename, student_name, student_number, student_phone,
+                                 initial_balance, used_amount, final_balance, groups)
                 
         except Exception as e:
             QMessageBox.critical(
@@ -2244,129 +3199,33 @@ class StudentReceiptsWidget(QWidget):
                 f"Failed to export CSV: {str(e)}"
             )
     
+    def on_purchase_export_finished(self, filename):
+        """Report a completed purchase history export"""
+        self.add_single_purchase_btn.setEnabled(bool(self.current_student_id))
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Purchase history exported to:\n{filename}"
+        )
+    
+    def on_purchase_export_failed(self, error):
+        """Report a failed purchase history export"""
+        self.add_single_purchase_btn.setEnabled(bool(self.current_student_id))
+        QMessageBox.critical(
+            self,
+            "Export Error", 
+            f"Failed to export CSV: {error}"
+        )
+    
     def categorize_component(self, component_code, component_desc):
         """Categorize component based on code and description"""
-        code_upper = component_code.upper()
-        desc_upper = component_desc.upper()
-        
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['RESISTOR', 'OHM', 'R_']):
-            return 'RESISTOR'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['CAPACITOR', 'CAP', 'UF', 'NF', 'PF', 'C_']):
-            return 'CAPACITOR'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['DIODE', 'LED', 'D_']):
-            return 'DIODE'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['IC', 'LM', 'MC', 'U_']):
-            return 'IC'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['TRANSISTOR', 'FET', 'IRF', 'T_']):
-            return 'TRANSISTORS'
-        else:
-            return 'OTHER COMPONENTS'
+        return categorize_by_keywords(PURCHASE_CATEGORY_RULES, component_code, component_desc)
     
     def write_csv_file(self, filename, student_name, student_number, student_phone, 
-                      initial_balance, used_amount, final_balance, component_groups):
+                      initial_balance, used_amount, final_balance, groups):
         """Write the CSV file in the expected format"""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header information
-            writer.writerow(['Student Name', student_name] + [''] * 22)
-            writer.writerow(['Student Number', student_number] + [''] * 22)
-            writer.writerow(['Contact', student_phone] + [''] * 22)
-            writer.writerow(['Paid', f"{initial_balance:.2f}"] + [''] * 22)
-            writer.writerow(['Used', f"{abs(used_amount):.2f}"] + [''] * 22)
-            writer.writerow(['Balance', f"{final_balance:.2f}"] + [''] * 22)
-            writer.writerow([''] * 24)  # Empty row
-            
-            # Component category headers
-            writer.writerow([
-                'RESISTOR', '', '', 'CAPACITOR', '', '', '', 'DIODE', '', '', '', 'IC', 'S', '', '', '', 
-                'TRANSISTORS', '', '', '', 'OTHER COMPONENTS', '', '', ''
-            ])
-            
-            # Subheaders
-            writer.writerow([
-                'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value', 
-                'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value',
-                'Quantity', 'Price', 'Total', 'Name', 'Value', 'Quantity', 'Price', 'Total'
-            ])
-            
-            # Find maximum number of items in any category
-            max_items = max(len(group['items']) for group in component_groups.values())
-            max_items = max(max_items, 10)  # Ensure at least 10 rows like in example
-            
-            # Write component data rows
-            for i in range(max_items):
-                try:
-                    # Add the component to the database with selected category
-                    category = self.category_combo.currentText()
-                    component_id = self.db_manager.insert_component(identifier, description, price, quantity, category)
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Component '{identifier}' added successfully!\nCategory: {category}"
-                    )
-                    self.accept()
-                except Exception as e:
-                    QMessageBox.critical(
-                        self,
-                        "Error",
-                        f"Failed to add component: {str(e)}"
-                    )
-                    row.append(component_groups['CAPACITOR']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # DIODE (columns 8-10)
-                if i < len(component_groups['DIODE']['items']):
-                    item = component_groups['DIODE']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # DIODE value (column 11)
-                if i < len(component_groups['DIODE']['items']):
-                    row.append(component_groups['DIODE']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # IC (columns 12-14)
-                if i < len(component_groups['IC']['items']):
-                    item = component_groups['IC']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # IC value (column 15)
-                if i < len(component_groups['IC']['items']):
-                    row.append(component_groups['IC']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # TRANSISTORS (columns 16-18)
-                if i < len(component_groups['TRANSISTORS']['items']):
-                    item = component_groups['TRANSISTORS']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # OTHER COMPONENTS (columns 19-23)
-                if i < len(component_groups['OTHER COMPONENTS']['items']):
-                    item = component_groups['OTHER COMPONENTS']['items'][i]
-                    row.extend([item['description'], item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '', '0'])
-                
-                writer.writerow(row)
-            
-            # Write totals row
-            totals_row = ['', '', f"{component_groups['RESISTOR']['total']:.2f}", '']
-            totals_row.extend(['', '', f"{component_groups['CAPACITOR']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['DIODE']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['IC']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['TRANSISTORS']['total']:.2f}", ''])
-            totals_row.extend(['', '', '', '', f"{component_groups['OTHER COMPONENTS']['total']:.2f}"])
-            
-            writer.writerow(totals_row)
+        write_purchase_csv(filename, student_name, student_number, student_phone,
+                           initial_balance, used_amount, final_balance, groups)
     
     def add_new_component(self):
         """Add a new component via popup dialog"""
@@ -2387,53 +3246,22 @@ class StudentReceiptsWidget(QWidget):
     
     def update_purchase_history_display(self):
         """Update the purchase history table display"""
-        # Temporarily disable sorting to prevent visual issues during table update
-        self.receipt_table.setSortingEnabled(False)
-        
-        self.receipt_table.setRowCount(len(self.student_transactions))
+        self.receipt_model.set_records(self.student_transactions)
         
         total_spent = 0.0
-        
-        for row, transaction in enumerate(self.student_transactions):
-            # Date (transaction[6])
-            date_str = transaction[6][:10] if transaction[6] else ''  # Just the date part
-            self.receipt_table.setItem(row, 0, QTableWidgetItem(date_str))
-            
-            # Component code from the joined query
-            self.receipt_table.setItem(row, 1, QTableWidgetItem(transaction[8]))   # component identifier
-            
-            # Quantity (transaction[3])
-            qty_item = QTableWidgetItem()
-            qty_item.setData(Qt.DisplayRole, transaction[3])
-            qty_item.setText(f"{transaction[3]:.1f}")
-            self.receipt_table.setItem(row, 2, qty_item)
-            
-            # Unit price (transaction[4])
-            price_item = QTableWidgetItem()
-            price_item.setData(Qt.DisplayRole, transaction[4])
-            price_item.setText(f"${transaction[4]:.2f}")
-            self.receipt_table.setItem(row, 3, price_item)
-            
-            # Total (transaction[5])
-            total_item = QTableWidgetItem()
-            total_item.setData(Qt.DisplayRole, transaction[5])
-            total_item.setText(f"${transaction[5]:.2f}")
-            self.receipt_table.setItem(row, 4, total_item)
-            
+        for transaction in self.student_transactions:
             total_spent += transaction[5]
         
         # Update summary labels
         self.transaction_count_label.setText(f"Transactions: {len(self.student_transactions)}")
         self.total_spent_label.setText(f"Total Spent: ${total_spent:.2f}")
         
-        # Re-enable sorting and sort by date descending (newest first)
-        self.receipt_table.setSortingEnabled(True)
-        self.receipt_table.sortItems(0, Qt.DescendingOrder)
+        # Sort by date descending (newest first)
+        self.receipt_table.sortByColumn(0, Qt.DescendingOrder)
     
     def show_receipt_context_menu(self, position):
         """Show context menu for purchase history"""
-        item = self.receipt_table.itemAt(position)
-        if item is None:
+        if not self.receipt_table.indexAt(position).isValid():
             return
         
         context_menu = QMenu(self)
@@ -2446,11 +3274,12 @@ class StudentReceiptsWidget(QWidget):
     
     def delete_selected_transaction(self):
         """Delete the selected transaction from history"""
-        current_row = self.receipt_table.currentRow()
-        if current_row < 0 or current_row >= len(self.student_transactions):
+        current_row = self.receipt_table.currentIndex().row()
+        if current_row < 0:
             return
         
-        transaction = self.student_transactions[current_row]
+        # Look the transaction up through the model, which holds rows in displayed order
+        transaction = self.receipt_model.record(current_row)
         transaction_id = transaction[0]  # transaction ID
         component_code = transaction[8]  # component identifier
         date_str = transaction[6][:10] if transaction[6] else ''
@@ -2919,6 +3748,7 @@ class ExportReportsWidget(QWidget):
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self.export_jobs = set()
         self.init_ui()
         self.refresh_data()
     
@@ -3074,14 +3904,23 @@ class ExportReportsWidget(QWidget):
         layout.addWidget(splitter)
         
         # Initially disable export buttons
-        self.export_btn.setEnabled(False)
-        self.preview_btn.setEnabled(False)
+        self._set_export_enabled(False)
     
     def refresh_data(self):
         """Refresh student list"""
         students = self.db_manager.get_students()
         students_with_default = [("-- Select Student --", None)] + students
+        
+        # Repopulate without re-entering on_student_changed for every inserted item
+        self.student_combo.blockSignals(True)
         self.student_combo.set_student_data(students_with_default)
+        self.student_combo.blockSignals(False)
+        self.on_student_changed()
+    
+    def _set_export_enabled(self, enabled):
+        """Enable or disable the per-student export buttons"""
+        self.export_btn.setEnabled(enabled)
+        self.preview_btn.setEnabled(enabled)
     
     def on_student_changed(self):
         """Handle student selection change"""
@@ -3109,12 +3948,10 @@ class ExportReportsWidget(QWidget):
 <b>Current Balance:</b> ${final_balance:.2f}"""
                 
                 self.student_info.setText(info_text)
-                self.export_btn.setEnabled(True)
-                self.preview_btn.setEnabled(True)
+                self._set_export_enabled(True)
         else:
             self.student_info.setText("No student selected")
-            self.export_btn.setEnabled(False)
-            self.preview_btn.setEnabled(False)
+            self._set_export_enabled(False)
         
         # Clear preview when student changes
         self.preview_text.clear()
@@ -3158,15 +3995,11 @@ class ExportReportsWidget(QWidget):
             )
             
             if filename:
-                # Generate and save export data
-                self.generate_and_save_export(student_id, filename)
-                
-                if self.db_manager.get_setting('show_info_popups', 'false') == 'true':
-                    QMessageBox.information(
-                        self,
-                        "Export Successful",
-                        f"Report exported successfully to:\n{filename}"
-                    )
+                # Read the report data here, then write the file in the background
+                export_args = self.collect_export_data(student_id)
+                self.export_btn.setEnabled(False)
+                start_export_job(self.export_jobs, self.on_export_finished, self.on_export_failed,
+                                 self.write_csv_file_tab_format, filename, *export_args)
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -3174,6 +4007,25 @@ class ExportReportsWidget(QWidget):
                 f"Failed to export report: {str(e)}"
             )
     
+    def on_export_finished(self, filename):
+        """Report a completed student report export"""
+        self.export_btn.setEnabled(bool(self.student_combo.currentData()))
+        if self.db_manager.get_setting('show_info_popups', 'false') == 'true':
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"Report exported successfully to:\n{filename}"
+            )
+    
+    def on_export_failed(self, error):
+        """Report a failed student report export"""
+        self.export_btn.setEnabled(bool(self.student_combo.currentData()))
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Failed to export report: {error}"
+        )
+    
     def export_final_statement(self):
         """Export final statement for all students"""
         try:
@@ -3211,40 +4063,40 @@ class ExportReportsWidget(QWidget):
     
     def generate_and_save_final_statement(self, students, filename):
         """Generate and save the final statement CSV"""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)  # Use comma delimiter (default)
+        # Table headers
+        rows = [['Student Name', 'Student Number', 'Balance', 'DUE TO STUDENT', 'DUE TO NUST']]
+        
+        # Data for each student
+        for student in students:
+            student_id = student[0]
+            student_name = student[1]
+            student_number = student[2]
             
-            # Write table headers
-            writer.writerow(['Student Name', 'Student Number', 'Balance', 'DUE TO STUDENT', 'DUE TO NUST'])
+            # Calculate final balance
+            final_balance = self.db_manager.get_student_final_balance(student_id)
             
-            # Write data for each student
-            for student in students:
-                student_id = student[0]
-                student_name = student[1]
-                student_number = student[2]
-                
-                # Calculate final balance
-                final_balance = self.db_manager.get_student_final_balance(student_id)
-                
-                # Determine DUE TO STUDENT or DUE TO NUST based on balance
-                due_to_student = ''
-                due_to_nust = ''
-                
-                if final_balance > 0:
-                    # Student has credit - money is due to student
-                    due_to_student = f"{final_balance:.2f}"
-                elif final_balance < 0:
-                    # Student owes money - money is due to NUST
-                    due_to_nust = f"{abs(final_balance):.2f}"
-                # If balance is 0, both columns remain empty
-                
-                writer.writerow([
-                    student_name,
-                    student_number,
-                    f"{final_balance:.2f}",
-                    due_to_student,
-                    due_to_nust
-                ])
+            # Determine DUE TO STUDENT or DUE TO NUST based on balance
+            due_to_student = ''
+            due_to_nust = ''
+            
+            if final_balance > 0:
+                # Student has credit - money is due to student
+                due_to_student = f"{final_balance:.2f}"
+            elif final_balance < 0:
+                # Student owes money - money is due to NUST
+                due_to_nust = f"{abs(final_balance):.2f}"
+            # If balance is 0, both columns remain empty
+            
+            rows.append([
+                student_name,
+                student_number,
+                f"{final_balance:.2f}",
+                due_to_student,
+                due_to_nust
+            ])
+        
+        # Use comma delimiter (default)
+        write_text_file(filename, render_csv(rows))
     
     def export_all_students(self):
         """Export reports for all students to a single CSV file"""
@@ -3283,170 +4135,118 @@ class ExportReportsWidget(QWidget):
     
     def generate_and_save_all_students_export(self, students, filename):
         """Generate and save the CSV export for all students"""
+        # 4 empty lines between student reports (not after the last student)
+        separator = render_csv([[]] * 4, dialect='tab_fast')
+        
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile, delimiter='\t')
-            
-            for i, student in enumerate(students):
-                student_id = student[0]
-                student_name = student[1]
-                student_number = student[2]
-                student_phone = student[5] if len(student) > 5 and student[5] else ""
-                
-                # Calculate balances
-                final_balance = self.db_manager.get_student_final_balance(student_id)
-                initial_balance = student[6] if len(student) > 6 else 0.0
-                
-                try:
-                    initial_balance = float(initial_balance) if initial_balance is not None else 0.0
-                except (ValueError, TypeError):
-                    initial_balance = 0.0
-                
-                used_amount = final_balance - initial_balance
-                
-                # Get transactions
-                transactions = self.db_manager.get_student_transactions(student_id)
-                
-                # Get selected categories (all categories)
-                selected_categories = self.get_selected_categories()
-                
-                # Group transactions by component category
-                component_groups = {
-                    'RESISTOR': {'items': [], 'total': 0},
-                    'CAPACITOR': {'items': [], 'total': 0}, 
-                    'DIODE': {'items': [], 'total': 0},
-                    'IC': {'items': [], 'total': 0},
-                    'TRANSISTORS': {'items': [], 'total': 0},
-                    'OTHER COMPONENTS': {'items': [], 'total': 0}
-                }
-                
-                # Process each transaction
-                for transaction in transactions:
-                    component_id = transaction[2]
-                    quantity = transaction[3]
-                    unit_price = transaction[4]
-                    total_cost = transaction[5]
+            # Render student reports on worker threads and write them in order from this thread
+            with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+                for start in range(0, len(students), EXPORT_FLUSH_INTERVAL):
+                    chunk = students[start:start + EXPORT_FLUSH_INTERVAL]
+                    if start:
+                        csvfile.write(separator)
                     
-                    # Get component details
-                    component = self.db_manager.get_component_by_id(component_id)
-                    if component:
-                        component_code = component[1]
-                        component_desc = component[2]
-                        
-                        # Get category from database first, fallback to dynamic categorization
-                        category = self.db_manager.get_component_category(component_id, component_code, component_desc)
-                        
-                        # Only include if category is selected (all categories in this case)
-                        if category in selected_categories:
-                            item = {
-                                'quantity': abs(quantity),  # Use absolute value for display
-                                'price': unit_price,
-                                'total': abs(total_cost),   # Use absolute value for display
-                                'value': component_code,
-                                'description': component_desc
-                            }
-                            
-                            component_groups[category]['items'].append(item)
-                            component_groups[category]['total'] += abs(total_cost)
+                    # One write per chunk keeps memory bounded on very large exports
+                    csvfile.write(separator.join(executor.map(self._render_student_report, chunk)))
+        
+        # The pool threads have exited; close the connections they opened
+        self.db_manager.release_finished_connections()
+    
+    def _render_student_report(self, student):
+        """Render the tab format report text for a single student"""
+        student_id = student[0]
+        student_name = student[1]
+        student_number = student[2]
+        student_phone = student[5] if len(student) > 5 and student[5] else ""
+        
+        # Calculate balances
+        final_balance = self.db_manager.get_student_final_balance(student_id)
+        initial_balance = student[6] if len(student) > 6 else 0.0
+        
+        try:
+            initial_balance = float(initial_balance) if initial_balance is not None else 0.0
+        except (ValueError, TypeError):
+            initial_balance = 0.0
+        
+        used_amount = final_balance - initial_balance
+        
+        # Get transactions
+        transactions = self.db_manager.get_student_transactions(student_id)
+        
+        # Group transactions by component category
+        groups = self._group_transactions(transactions)
+        
+        return render_csv(self.build_student_rows(student_name, student_number, student_phone,
+                                                  initial_balance, used_amount, final_balance, groups),
+                          dialect='tab_fast')
+    
+    def _group_transactions(self, transactions):
+        """Group transactions into [items, total] pairs in CATEGORIES order"""
+        groups = [[[], 0.0] for _ in CATEGORIES]
+        
+        for transaction in transactions:
+            component_id = transaction[2]
+            quantity = transaction[3]
+            unit_price = transaction[4]
+            total_cost = transaction[5]
+            
+            # Get component details
+            component = self.db_manager.get_component_by_id(component_id)
+            if component:
+                component_code = component[1]
+                component_desc = component[2]
                 
-                # Write the student's export data using the same format
-                self.write_student_data_to_csv(writer, student_name, student_number, student_phone, 
-                                              initial_balance, used_amount, final_balance, component_groups)
+                # Get category from database first, fallback to dynamic categorization
+                category = self.db_manager.get_component_category(component_id, component_code, component_desc)
                 
-                # Add 4 empty lines between student reports (except after the last student)
-                if i < len(students) - 1:
-                    for _ in range(4):
-                        writer.writerow([])
+                # Only include known categories
+                idx = CATEGORY_INDEX.get(category)
+                if idx is not None:
+                    # (value, quantity, price, total, description) using absolute values for display;
+                    # the tab layout ignores the description, the comma-separated layout reads it
+                    total_abs = abs(total_cost)
+                    group = groups[idx]
+                    group[0].append((component_code, abs(quantity), '%.2f' % unit_price, '%.2f' % total_abs,
+                                     component_desc))
+                    group[1] += total_abs
+        
+        return groups
     
     def write_student_data_to_csv(self, writer, student_name, student_number, student_phone, 
-                                  initial_balance, used_amount, final_balance, component_groups):
+                                  initial_balance, used_amount, final_balance, groups):
         """Write a single student's data to the CSV writer using tab format"""
-        # Header information
-        writer.writerow(['Student Name', student_name])
-        writer.writerow(['Student Number', student_number])
-        writer.writerow(['Contact', student_phone])
-        writer.writerow(['Paid', int(initial_balance) if initial_balance == int(initial_balance) else initial_balance])
-        writer.writerow(['Used', abs(used_amount)])
-        writer.writerow(['Balance', final_balance])
-        writer.writerow([])  # Empty row
-        
-        # Component category headers (4 columns each)
-        writer.writerow([
-            'RESISTOR', '', '', '', 'CAPACITOR', '', '', '', 'DIODE', '', '', '', 
-            'IC', '', '', '', 'TRANSISTORS', '', '', '', 'OTHER COMPONENTS', '', '', ''
-        ])
-        
-        # Subheaders
-        writer.writerow([
-            'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 
-            'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total',
-            'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total'
-        ])
-        
-        # Find maximum number of items in any category
-        max_items = max(len(group['items']) for group in component_groups.values()) if any(component_groups.values()) else 0
-        max_items = max(max_items, 10)  # Ensure at least 10 rows
-        
-        # Write component data rows
-        for i in range(max_items):
-            row = []
-            
-            # RESISTOR (Value, Quantity, Price, Total)
-            if i < len(component_groups['RESISTOR']['items']):
-                item = component_groups['RESISTOR']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            # CAPACITOR (Value, Quantity, Price, Total)
-            if i < len(component_groups['CAPACITOR']['items']):
-                item = component_groups['CAPACITOR']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            # DIODE (Value, Quantity, Price, Total)
-            if i < len(component_groups['DIODE']['items']):
-                item = component_groups['DIODE']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            # IC (Value, Quantity, Price, Total)
-            if i < len(component_groups['IC']['items']):
-                item = component_groups['IC']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            # TRANSISTORS (Value, Quantity, Price, Total)
-            if i < len(component_groups['TRANSISTORS']['items']):
-                item = component_groups['TRANSISTORS']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            # OTHER COMPONENTS (Value, Quantity, Price, Total)
-            if i < len(component_groups['OTHER COMPONENTS']['items']):
-                item = component_groups['OTHER COMPONENTS']['items'][i]
-                row.extend([item['value'], item['quantity'], item['price'], item['total']])
-            else:
-                row.extend(['', '', '', '0'])
-            
-            writer.writerow(row)
-        
-        # Write totals row
-        totals_row = ['', '', '', f"{component_groups['RESISTOR']['total']}"]
-        totals_row.extend(['', '', '', f"{component_groups['CAPACITOR']['total']}"])
-        totals_row.extend(['', '', '', f"{component_groups['DIODE']['total']}"])
-        totals_row.extend(['', '', '', f"{component_groups['IC']['total']}"])
-        totals_row.extend(['', '', '', f"{component_groups['TRANSISTORS']['total']}"])
-        totals_row.extend(['', '', '', f"{component_groups['OTHER COMPONENTS']['total']}"])
-        
-        writer.writerow(totals_row)
+        writer.writerows(self.build_student_rows(student_name, student_number, student_phone,
+                                                 initial_balance, used_amount, final_balance, groups))
+    
+    def build_student_rows(self, student_name, student_number, student_phone, 
+                           initial_balance, used_amount, final_balance, groups):
+        """Build a single student's tab format rows"""
+        header_rows = [
+            ['Student Name', student_name],
+            ['Student Number', student_number],
+            ['Contact', student_phone],
+            ['Paid', int(initial_balance) if initial_balance == int(initial_balance) else initial_balance],
+            ['Used', abs(used_amount)],
+            ['Balance', final_balance],
+            (),  # Empty row
+            TAB_CATEGORY_HEADER,
+            TAB_SUBHEADER,
+        ]
+        return _build_bom_rows(TAB_LAYOUT, header_rows, groups)
 
     def generate_export_data(self, student_id, preview_mode=False):
         """Generate export data for preview or actual export"""
         # Get student information
+        # Validate the optional date range once before querying
+        date_from = self.date_from.text().strip()
+        date_to = self.date_to.text().strip()
+        for date_text in (date_from, date_to):
+            if date_text:
+                try:
+                    datetime.strptime(date_text, '%Y-%m-%d')
+                except ValueError:
+                    return f"Invalid date '{date_text}'. Please use the YYYY-MM-DD format."
+        
         student_data = self.db_manager.get_student_by_id(student_id)
         if not student_data:
             return "Student data not found."
@@ -3470,19 +4270,7 @@ class ExportReportsWidget(QWidget):
         selected_categories = self.get_selected_categories()
         
         # Get transactions (with date filtering if specified)
-        transactions = self.db_manager.get_student_transactions(student_id)
-        
-        # Filter by date range if specified
-        date_from = self.date_from.text().strip()
-        date_to = self.date_to.text().strip()
-        
-        if date_from or date_to:
-            filtered_transactions = []
-            for transaction in transactions:
-                # Assuming transaction has timestamp - you may need to adjust based on your schema
-                # For now, include all transactions if date filtering is requested but not implemented
-                filtered_transactions.append(transaction)
-            transactions = filtered_transactions
+        transactions = self.db_manager.get_student_transactions(student_id, date_from, date_to)
         
         if preview_mode:
             # Generate text preview
@@ -3518,7 +4306,10 @@ class ExportReportsWidget(QWidget):
     
     def generate_and_save_export(self, student_id, filename):
         """Generate and save the actual CSV export"""
-        # Reuse the existing CSV export logic
+        self.write_csv_file_tab_format(filename, *self.collect_export_data(student_id))
+    
+    def collect_export_data(self, student_id):
+        """Read the student details, balances and grouped transactions for a report"""
         # Get student information
         student_data = self.db_manager.get_student_by_id(student_id)
         student_name = student_data[1]
@@ -3539,146 +4330,22 @@ class ExportReportsWidget(QWidget):
         # Get transactions
         transactions = self.db_manager.get_student_transactions(student_id)
         
-        # Get selected categories
-        selected_categories = self.get_selected_categories()
-        
         # Group transactions by component category
-        component_groups = {
-            'RESISTOR': {'items': [], 'total': 0},
-            'CAPACITOR': {'items': [], 'total': 0}, 
-            'DIODE': {'items': [], 'total': 0},
-            'IC': {'items': [], 'total': 0},
-            'TRANSISTORS': {'items': [], 'total': 0},
-            'OTHER COMPONENTS': {'items': [], 'total': 0}
-        }
-        
-        # Process each transaction
-        for transaction in transactions:
-            component_id = transaction[2]
-            quantity = transaction[3]
-            unit_price = transaction[4]
-            total_cost = transaction[5]
-            
-            # Get component details
-            component = self.db_manager.get_component_by_id(component_id)
-            if component:
-                component_code = component[1]
-                component_desc = component[2]
-                
-                # Get category from database first, fallback to dynamic categorization
-                category = self.db_manager.get_component_category(component_id, component_code, component_desc)
-                
-                # Only include if category is selected
-                if category in selected_categories:
-                    item = {
-                        'quantity': abs(quantity),  # Use absolute value for display
-                        'price': unit_price,
-                        'total': abs(total_cost),   # Use absolute value for display
-                        'value': component_code,
-                        'description': component_desc
-                    }
-                    
-                    component_groups[category]['items'].append(item)
-                    component_groups[category]['total'] += abs(total_cost)
+        groups = self._group_transactions(transactions)
         
-        # Use the new CSV format method
-        self.write_csv_file_tab_format(filename, student_name, student_number, student_phone, 
-                          initial_balance, used_amount, final_balance, component_groups)
+        return (student_name, student_number, student_phone,
+                initial_balance, used_amount, final_balance, groups)
     
     def write_csv_file_tab_format(self, filename, student_name, student_number, student_phone, 
-                      initial_balance, used_amount, final_balance, component_groups):
+                      initial_balance, used_amount, final_balance, groups):
         """Write the CSV file in tab-delimited format"""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile, delimiter='\t')
-            
-            # Header information
-            writer.writerow(['Student Name', student_name])
-            writer.writerow(['Student Number', student_number])
-            writer.writerow(['Contact', student_phone])
-            writer.writerow(['Paid', int(initial_balance) if initial_balance == int(initial_balance) else initial_balance])
-            writer.writerow(['Used', abs(used_amount)])
-            writer.writerow(['Balance', final_balance])
-            writer.writerow([])  # Empty row
-            
-            # Component category headers (4 columns each)
-            writer.writerow([
-                'RESISTOR', '', '', '', 'CAPACITOR', '', '', '', 'DIODE', '', '', '', 
-                'IC', '', '', '', 'TRANSISTORS', '', '', '', 'OTHER COMPONENTS', '', '', ''
-            ])
-            
-            # Subheaders
-            writer.writerow([
-                'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 
-                'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total',
-                'Value', 'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total'
-            ])
-            
-            # Find maximum number of items in any category
-            max_items = max(len(group['items']) for group in component_groups.values()) if any(component_groups.values()) else 0
-            max_items = max(max_items, 10)  # Ensure at least 10 rows
-            
-            # Write component data rows
-            for i in range(max_items):
-                row = []
-                
-                # RESISTOR (Value, Quantity, Price, Total)
-                if i < len(component_groups['RESISTOR']['items']):
-                    item = component_groups['RESISTOR']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                # CAPACITOR (Value, Quantity, Price, Total)
-                if i < len(component_groups['CAPACITOR']['items']):
-                    item = component_groups['CAPACITOR']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                # DIODE (Value, Quantity, Price, Total)
-                if i < len(component_groups['DIODE']['items']):
-                    item = component_groups['DIODE']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                # IC (Value, Quantity, Price, Total)
-                if i < len(component_groups['IC']['items']):
-                    item = component_groups['IC']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                # TRANSISTORS (Value, Quantity, Price, Total)
-                if i < len(component_groups['TRANSISTORS']['items']):
-                    item = component_groups['TRANSISTORS']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                # OTHER COMPONENTS (Value, Quantity, Price, Total)
-                if i < len(component_groups['OTHER COMPONENTS']['items']):
-                    item = component_groups['OTHER COMPONENTS']['items'][i]
-                    row.extend([item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '0'])
-                
-                writer.writerow(row)
-            
-            # Write totals row
-            totals_row = ['', '', '', f"{component_groups['RESISTOR']['total']}"]
-            totals_row.extend(['', '', '', f"{component_groups['CAPACITOR']['total']}"])
-            totals_row.extend(['', '', '', f"{component_groups['DIODE']['total']}"])
-            totals_row.extend(['', '', '', f"{component_groups['IC']['total']}"])
-            totals_row.extend(['', '', '', f"{component_groups['TRANSISTORS']['total']}"])
-            totals_row.extend(['', '', '', f"{component_groups['OTHER COMPONENTS']['total']}"])
-            
-            writer.writerow(totals_row)
+        rows = self.build_student_rows(student_name, student_number, student_phone,
+                                       initial_balance, used_amount, final_balance, groups)
+        write_text_file(filename, render_csv(rows, dialect='tab_fast'))
     
     def categorize_component(self, component_code, component_desc):
         """Categorize component based on code and description"""
         code_upper = component_code.upper()
-        desc_upper = component_desc.upper()
         
         # Special case: if component code looks like a capacitor value but might be misnamed
         # Check if this should actually be a resistor based on other factors
@@ -3690,140 +4357,31 @@ class ExportReportsWidget(QWidget):
         if "LED" in code_upper:
             return 'OTHER COMPONENTS'
         
-        if any(keyword in code_upper or keyword in desc_upper for keyword in ['RESISTOR', 'OHM', 'RES', 'R_']):
-            return 'RESISTOR'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['CAPACITOR', 'CAP', 'UF', 'NF', 'PF', 'C_']):
-            return 'CAPACITOR'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['DIODE', 'D_']):
-            return 'DIODE'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['IC', 'LM', 'MC', 'U_']):
-            return 'IC'
-        elif any(keyword in code_upper or keyword in desc_upper for keyword in ['TRANSISTOR', 'FET', 'IRF', 'T_']):
-            return 'TRANSISTORS'
-        else:
-            return 'OTHER COMPONENTS'
+        return categorize_by_keywords(REPORT_CATEGORY_RULES, component_code, component_desc)
     
     def write_csv_file(self, filename, student_name, student_number, student_phone, 
-                      initial_balance, used_amount, final_balance, component_groups):
+                      initial_balance, used_amount, final_balance, groups):
         """Write the CSV file in the expected format"""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header information
-            writer.writerow(['Student Name', student_name] + [''] * 22)
-            writer.writerow(['Student Number', student_number] + [''] * 22)
-            writer.writerow(['Contact', student_phone] + [''] * 22)
-            writer.writerow(['Paid', f"{initial_balance:.2f}"] + [''] * 22)
-            writer.writerow(['Used', f"{abs(used_amount):.2f}"] + [''] * 22)
-            writer.writerow(['Balance', f"{final_balance:.2f}"] + [''] * 22)
-            writer.writerow([''] * 24)  # Empty row
-            
-            # Component category headers
-            writer.writerow([
-                'RESISTOR', '', '', 'CAPACITOR', '', '', '', 'DIODE', '', '', '', 'IC', 'S', '', '', '', 
-                'TRANSISTORS', '', '', '', 'OTHER COMPONENTS', '', '', ''
-            ])
-            
-            # Subheaders
-            writer.writerow([
-                'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value', 
-                'Quantity', 'Price', 'Total', 'Value', 'Quantity', 'Price', 'Total', 'Value',
-                'Quantity', 'Price', 'Total', 'Name', 'Value', 'Quantity', 'Price', 'Total'
-            ])
-            
-            # Find maximum number of items in any category
-            max_items = max(len(group['items']) for group in component_groups.values()) if any(component_groups.values()) else 0
-            max_items = max(max_items, 10)  # Ensure at least 10 rows like in example
-            
-            # Write component data rows
-            for i in range(max_items):
-                row = []
-                
-                # RESISTOR (columns 0-2)
-                if i < len(component_groups['RESISTOR']['items']):
-                    item = component_groups['RESISTOR']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # RESISTOR value (column 3)
-                if i < len(component_groups['RESISTOR']['items']):
-                    row.append(component_groups['RESISTOR']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # CAPACITOR (columns 4-6)
-                if i < len(component_groups['CAPACITOR']['items']):
-                    item = component_groups['CAPACITOR']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # CAPACITOR value (column 7)
-                if i < len(component_groups['CAPACITOR']['items']):
-                    row.append(component_groups['CAPACITOR']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # DIODE (columns 8-10)
-                if i < len(component_groups['DIODE']['items']):
-                    item = component_groups['DIODE']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # DIODE value (column 11)
-                if i < len(component_groups['DIODE']['items']):
-                    row.append(component_groups['DIODE']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # IC (columns 12-14)
-                if i < len(component_groups['IC']['items']):
-                    item = component_groups['IC']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # IC value (column 15)
-                if i < len(component_groups['IC']['items']):
-                    row.append(component_groups['IC']['items'][i]['value'])
-                else:
-                    row.append('')
-                
-                # TRANSISTORS (columns 16-18)
-                if i < len(component_groups['TRANSISTORS']['items']):
-                    item = component_groups['TRANSISTORS']['items'][i]
-                    row.extend([item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '0'])
-                
-                # OTHER COMPONENTS (columns 19-23)
-                if i < len(component_groups['OTHER COMPONENTS']['items']):
-                    item = component_groups['OTHER COMPONENTS']['items'][i]
-                    row.extend([item['description'], item['value'], item['quantity'], item['price'], item['total']])
-                else:
-                    row.extend(['', '', '', '', '0'])
-                
-                writer.writerow(row)
-            
-            # Write totals row
-            totals_row = ['', '', f"{component_groups['RESISTOR']['total']:.2f}", '']
-            totals_row.extend(['', '', f"{component_groups['CAPACITOR']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['DIODE']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['IC']['total']:.2f}", ''])
-            totals_row.extend(['', '', f"{component_groups['TRANSISTORS']['total']:.2f}", ''])
-            totals_row.extend(['', '', '', '', f"{component_groups['OTHER COMPONENTS']['total']:.2f}"])
-            
-            writer.writerow(totals_row)
+        write_purchase_csv(filename, student_name, student_number, student_phone,
+                           initial_balance, used_amount, final_balance, groups)
 
 
 class SettingsWidget(QWidget):
     """Widget for application settings"""
     
+    # Emitted after changed settings have been written to the database
+    settings_changed = pyqtSignal()
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        
+        # Coalesce bursts of changes into a single settings write
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SETTINGS_SAVE_DELAY)
+        self.save_timer.timeout.connect(self.write_settings)
+        
         self.init_ui()
         self.load_settings()
     
@@ -3895,54 +4453,46 @@ class SettingsWidget(QWidget):
     def load_settings(self):
         """Load settings from database"""
         try:
-            # Load purchase confirmation setting (default: True)
-            confirm_purchases = self.db_manager.get_setting('confirm_purchases', 'true')
-            self.confirm_purchases_checkbox.setChecked(confirm_purchases.lower() == 'true')
+            # Load all settings in one query
+            settings = self.db_manager.get_settings({
+                'confirm_purchases': 'true',           # default: True
+                'show_success_popups': 'false',        # default: False to reduce interruptions
+                'show_info_popups': 'false',           # default: False to reduce interruptions
+                'confirm_category_changes': 'true',
+                'font_size': '10.0',
+            })
             
-            # Load success popups setting (default: False to reduce interruptions)
-            show_success_popups = self.db_manager.get_setting('show_success_popups', 'false')
-            self.show_success_popups_checkbox.setChecked(show_success_popups.lower() == 'true')
-            
-            # Load info popups setting (default: False to reduce interruptions)
-            show_info_popups = self.db_manager.get_setting('show_info_popups', 'false')
-            self.show_info_popups_checkbox.setChecked(show_info_popups.lower() == 'true')
-            
-            # Load confirm category changes setting
-            confirm_category_changes = self.db_manager.get_setting('confirm_category_changes', 'true')
-            self.confirm_category_changes_checkbox.setChecked(confirm_category_changes.lower() == 'true')
-
-            # Load font size setting
-            font_size = self.db_manager.get_setting('font_size', '10.0')
-            self.font_size_spinbox.setValue(float(font_size))
+            self.confirm_purchases_checkbox.setChecked(settings['confirm_purchases'].lower() == 'true')
+            self.show_success_popups_checkbox.setChecked(settings['show_success_popups'].lower() == 'true')
+            self.show_info_popups_checkbox.setChecked(settings['show_info_popups'].lower() == 'true')
+            self.confirm_category_changes_checkbox.setChecked(settings['confirm_category_changes'].lower() == 'true')
+            self.font_size_spinbox.setValue(float(settings['font_size']))
         except Exception as e:
             print(f"Error loading settings: {e}")
             # Set defaults
             self.confirm_purchases_checkbox.setChecked(True)
             self.show_success_popups_checkbox.setChecked(False)
             self.show_info_popups_checkbox.setChecked(False)
+        
+        # Populating the controls is not a user change, so there is nothing to save
+        self.save_timer.stop()
     
     def save_settings(self):
+        """Schedule saving settings to database"""
+        self.save_timer.start()
+    
+    def write_settings(self):
         """Save settings to database"""
         try:
-            # Save purchase confirmation setting
-            confirm_purchases = 'true' if self.confirm_purchases_checkbox.isChecked() else 'false'
-            self.db_manager.set_setting('confirm_purchases', confirm_purchases)
-            
-            # Save success popups setting
-            show_success_popups = 'true' if self.show_success_popups_checkbox.isChecked() else 'false'
-            self.db_manager.set_setting('show_success_popups', show_success_popups)
-            
-            # Save info popups setting
-            show_info_popups = 'true' if self.show_info_popups_checkbox.isChecked() else 'false'
-            self.db_manager.set_setting('show_info_popups', show_info_popups)
-            
-            # Save confirm category changes setting
-            confirm_category_changes = 'true' if self.confirm_category_changes_checkbox.isChecked() else 'false'
-            self.db_manager.set_setting('confirm_category_changes', confirm_category_changes)
-
-            # Save font size setting
-            font_size = str(self.font_size_spinbox.value())
-            self.db_manager.set_setting('font_size', font_size)
+            # Save all settings in one transaction
+            self.db_manager.set_settings({
+                'confirm_purchases': 'true' if self.confirm_purchases_checkbox.isChecked() else 'false',
+                'show_success_popups': 'true' if self.show_success_popups_checkbox.isChecked() else 'false',
+                'show_info_popups': 'true' if self.show_info_popups_checkbox.isChecked() else 'false',
+                'confirm_category_changes': 'true' if self.confirm_category_changes_checkbox.isChecked() else 'false',
+                'font_size': str(self.font_size_spinbox.value()),
+            })
+            self.settings_changed.emit()
         except Exception as e:
             print(f"Error saving settings: {e}")
     
@@ -3954,13 +4504,29 @@ class SettingsWidget(QWidget):
 class CategorySettingsWidget(QWidget):
     """Widget for managing component categories with component list and radio buttons"""
     
+    # Lowercased "identifier\ndescription" stored on the ID column for the search filter
+    FILTER_ROLE = Qt.UserRole
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
         self.selected_component_id = None
+        self.category_items = {}  # component id -> 'Current Category' table item
+        self.reload_settings()
         self.init_ui()
         self.refresh_data()
     
+    def reload_settings(self):
+        """Cache the popup and confirmation settings used when applying categories"""
+        settings = self.db_manager.get_settings({
+            'show_info_popups': 'false',
+            'show_success_popups': 'false',
+            'confirm_category_changes': 'true',
+        })
+        self.show_info_popups = settings['show_info_popups'] == 'true'
+        self.show_success_popups = settings['show_success_popups'] == 'true'
+        self.confirm_category_changes = settings['confirm_category_changes'].lower() == 'true'
+    
     def init_ui(self):
         layout = QVBoxLayout(self)
         
@@ -3982,18 +4548,33 @@ class CategorySettingsWidget(QWidget):
         search_label = QLabel("Search:")
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search by identifier or description...")
-        self.search_edit.textChanged.connect(self.filter_components)
+        
+        # Apply the search once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(SEARCH_FILTER_DELAY)
+        self.filter_timer.timeout.connect(self.filter_components)
+        self.search_edit.textChanged.connect(self.filter_timer.start)
         
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_edit)
         left_layout.addLayout(search_layout)
         
-        # Components table widget
-        self.components_table = QTableWidget()
-        self.components_table.setColumnCount(4)
-        self.components_table.setHorizontalHeaderLabels(['ID', 'Identifier', 'Description', 'Current Category'])
+        # Components model, filtered and sorted by a proxy in front of the table view
+        self.components_model = QStandardItemModel(0, 4, self)
+        self.components_model.setHorizontalHeaderLabels(['ID', 'Identifier', 'Description', 'Current Category'])
+        
+        self.components_proxy = QSortFilterProxyModel(self)
+        self.components_proxy.setSourceModel(self.components_model)
+        self.components_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.components_proxy.setFilterKeyColumn(0)
+        self.components_proxy.setFilterRole(self.FILTER_ROLE)
+        
+        self.components_table = QTableView()
+        self.components_table.setModel(self.components_proxy)
         self.components_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.components_table.itemClicked.connect(self.on_component_selected)
+        self.components_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.components_table.clicked.connect(self.on_component_selected)
         
         # Set column widths
         header = self.components_table.horizontalHeader()
@@ -4003,6 +4584,9 @@ class CategorySettingsWidget(QWidget):
         header.setSectionResizeMode(2, QHeaderView.Stretch)           # Description
         header.setSectionResizeMode(3, QHeaderView.Interactive)       # Current Category
         
+        # Fixed row heights so filling the table does not measure every row
+        self.components_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        
         # Enable sorting
         self.components_table.setSortingEnabled(True)
         
@@ -4067,61 +4651,60 @@ class CategorySettingsWidget(QWidget):
         
     def refresh_components(self):
         """Refresh the components table"""
-        # Temporarily disable sorting to prevent visual issues
+        # Temporarily disable sorting and repaints while the rows are rebuilt
         self.components_table.setSortingEnabled(False)
+        self.components_proxy.setDynamicSortFilter(False)
+        self.components_table.setUpdatesEnabled(False)
         
         # Get all components
         components = self.db_manager.get_components()
         
-        self.components_table.setRowCount(len(components))
+        # Drop the old items rather than overwriting them in place
+        self.components_model.setRowCount(0)
+        self.components_model.setRowCount(len(components))
+        self.category_items = {}
         
         for row, component in enumerate(components):
             component_id, identifier, description, price, quantity, category, created_at, updated_at= component
+            identifier_text = str(identifier) if identifier is not None else ''
+            description_text = str(description) if description is not None else ''
             
-            # ID column
-            id_item = QTableWidgetItem()
-            id_item.setData(Qt.DisplayRole, component_id)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemIsEditable)
-            self.components_table.setItem(row, 0, id_item)
+            # ID column, also carrying the search text
+            id_item = QStandardItem()
+            id_item.setData(component_id, Qt.DisplayRole)
+            id_item.setData(f"{identifier_text}\n{description_text}".lower(), self.FILTER_ROLE)
+            self.components_model.setItem(row, 0, id_item)
             
             # Identifier column
-            identifier_item = QTableWidgetItem(str(identifier) if identifier is not None else '')
-            identifier_item.setFlags(identifier_item.flags() & ~Qt.ItemIsEditable)
-            self.components_table.setItem(row, 1, identifier_item)
+            self.components_model.setItem(row, 1, QStandardItem(identifier_text))
             
             # Description column
-            description_item = QTableWidgetItem(str(description) if description is not None else '')
-            description_item.setFlags(description_item.flags() & ~Qt.ItemIsEditable)
-            self.components_table.setItem(row, 2, description_item)
+            self.components_model.setItem(row, 2, QStandardItem(description_text))
             
             # Current category column
             current_category = str(category) if category is not None else 'Not Set'
-            current_category_item = QTableWidgetItem(current_category)
-            current_category_item.setFlags(current_category_item.flags() & ~Qt.ItemIsEditable)
-            self.components_table.setItem(row, 3, current_category_item)
+            current_category_item = QStandardItem(current_category)
+            self.components_model.setItem(row, 3, current_category_item)
+            self.category_items[component_id] = current_category_item
         
-        # Re-enable sorting
+        # Re-enable sorting and repaint once
+        self.components_proxy.setDynamicSortFilter(True)
         self.components_table.setSortingEnabled(True)
+        self.components_table.setUpdatesEnabled(True)
     
     def filter_components(self):
         """Filter components based on search text"""
-        search_text = self.search_edit.text().lower()
-        
-        for row in range(self.components_table.rowCount()):
-            # Get row data
-            identifier = self.components_table.item(row, 1).text().lower()
-            description = self.components_table.item(row, 2).text().lower()
-            
-            # Show/hide row based on search
-            if search_text == '' or search_text in identifier or search_text in description:
-                self.components_table.setRowHidden(row, False)
-            else:
-                self.components_table.setRowHidden(row, True)
+        # Matches identifier or description; the proxy does the row scan in Qt
+        self.components_proxy.setFilterFixedString(self.search_edit.text().lower())
     
-    def on_component_selected(self, item):
+    def on_component_selected(self, index):
         """Handle component selection from the table"""
-        row = item.row()
-        self.selected_component_id = self.components_table.item(row, 0).data(Qt.DisplayRole)
+        row = self.components_proxy.mapToSource(index).row()
+        self.select_component(self.components_model.item(row, 0).data(Qt.DisplayRole))
+    
+    def select_component(self, component_id):
+        """Show the category of the given component and enable applying a new one"""
+        self.selected_component_id = component_id
         
         # Get component details
         component_data = self.db_manager.get_component_by_id(self.selected_component_id)
@@ -4198,14 +4781,12 @@ class CategorySettingsWidget(QWidget):
         
         # Check if category is actually changing
         if selected_category == current_category:
-            if self.db_manager.get_setting('show_info_popups', 'false') == 'true':
+            if self.show_info_popups:
                 QMessageBox.information(self, "Info", f"Component '{identifier}' already has category '{selected_category}'")
             return
         
         # Check if confirmation is enabled
-        should_confirm = self.db_manager.get_setting('confirm_category_changes', 'true').lower() == 'true'
-        
-        if should_confirm:
+        if self.confirm_category_changes:
             # Confirm the change
             reply = QMessageBox.question(
                 self,
@@ -4223,17 +4804,22 @@ class CategorySettingsWidget(QWidget):
                 component_id, identifier, description, price, quantity, selected_category
             )
             
-            # Refresh the components table to show the change
-            self.refresh_components()
+            # Update the component's category cell in place, rebuilding only if it is not listed
+            category_item = self.category_items.get(component_id)
+            if category_item is not None:
+                category_item.setText(selected_category)
+            else:
+                self.refresh_components()
+                category_item = self.category_items.get(component_id)
             
             # Reselect the same component in the table to update the display
-            for row in range(self.components_table.rowCount()):
-                if self.components_table.item(row, 0).data(Qt.DisplayRole) == component_id:
-                    self.components_table.selectRow(row)
-                    self.on_component_selected(self.components_table.item(row, 0))
-                    break
+            if category_item is not None:
+                index = self.components_proxy.mapFromSource(category_item.index())
+                if index.isValid():
+                    self.components_table.selectRow(index.row())
+            self.select_component(component_id)
             
-            if self.db_manager.get_setting('show_success_popups', 'false') == 'true':
+            if self.show_success_popups:
                 QMessageBox.information(
                     self,
                     "Success",
@@ -4247,9 +4833,20 @@ class CategorySettingsWidget(QWidget):
 class ComponentManagerApp(QMainWindow):
     """Main application window"""
     
+    # Tabs in display order: attribute holding the widget, widget class, tab title
+    TABS = (
+        ('component_widget', ComponentWidget, "Components"),
+        ('student_widget', StudentWidget, "Students"),
+        ('student_receipts_widget', StudentReceiptsWidget, "Student Transactions"),
+        ('export_reports_widget', ExportReportsWidget, "Export Reports"),
+        ('category_settings_widget', CategorySettingsWidget, "Category Modify"),
+        ('settings_widget', SettingsWidget, "Settings"),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.db_manager = DatabaseManager()
+        self.db_manager = get_db()
+        self.refresh_running = False
         self.init_ui()
         
     def init_ui(self):
@@ -4267,20 +4864,11 @@ class ComponentManagerApp(QMainWindow):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Add tabs
-        self.component_widget = ComponentWidget(self.db_manager)
-        self.student_widget = StudentWidget(self.db_manager)
-        self.student_receipts_widget = StudentReceiptsWidget(self.db_manager)
-        self.export_reports_widget = ExportReportsWidget(self.db_manager)
-        self.category_settings_widget = CategorySettingsWidget(self.db_manager)
-        self.settings_widget = SettingsWidget(self.db_manager)
-        
-        self.tab_widget.addTab(self.component_widget, "Components")
-        self.tab_widget.addTab(self.student_widget, "Students")
-        self.tab_widget.addTab(self.student_receipts_widget, "Student Transactions")
-        self.tab_widget.addTab(self.export_reports_widget, "Export Reports")
-        self.tab_widget.addTab(self.category_settings_widget, "Category Modify")
-        self.tab_widget.addTab(self.settings_widget, "Settings")
+        # Add tabs as placeholders; each widget is built the first time its tab is shown
+        for attr, widget_class, title in self.TABS:
+            setattr(self, attr, None)
+            self.tab_widget.addTab(QWidget(), title)
+        self.build_tab(0)
         
         # Connect signals to refresh data when switching tabs
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -4298,72 +4886,6 @@ class ComponentManagerApp(QMainWindow):
         font = self.font()
         font.setPointSizeF(float(font_size))
         self.setFont(font)
-        
-        # Style the application
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QTableWidget {
-                gridline-color: #cccccc;
-                background-color: white;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border: 1px solid #cccccc;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #45a049;
-                color: white;
-            }
-        """)
     
     def create_menu_bar(self):
         """Create application menu bar"""
@@ -4401,8 +4923,42 @@ class ComponentManagerApp(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def build_tab(self, index):
+        """Replace a tab's placeholder with its real widget"""
+        attr, widget_class, title = self.TABS[index]
+        widget = widget_class(self.db_manager)
+        setattr(self, attr, widget)
+        
+        # Keep cached settings in step with the Settings tab
+        if widget_class is SettingsWidget:
+            widget.settings_changed.connect(self.on_settings_changed)
+        
+        # Swap the widget in without re-entering on_tab_changed
+        current_index = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+        return widget
+    
+    def built_tabs(self):
+        """Tab widgets that have been built so far"""
+        widgets = (getattr(self, attr) for attr, widget_class, title in self.TABS)
+        return [widget for widget in widgets if widget is not None]
+    
+    def on_settings_changed(self):
+        """Reload settings cached by the Category Modify tab"""
+        if self.category_settings_widget is not None:
+            self.category_settings_widget.reload_settings()
+    
     def on_tab_changed(self, index):
         """Handle tab change to refresh data"""
+        # A newly built widget has just loaded its data
+        if getattr(self, self.TABS[index][0]) is None:
+            self.build_tab(index)
+            return
+        
         current_widget = self.tab_widget.widget(index)
         if hasattr(current_widget, 'refresh_data'):
             current_widget.refresh_data()
@@ -4418,17 +4974,20 @@ class ComponentManagerApp(QMainWindow):
         self.component_widget.import_csv()
     
     def refresh_all_data(self):
-        """Refresh data in all tabs"""
-        widgets = [
-            self.component_widget,
-            self.student_widget,
-            self.student_receipts_widget,
-            self.export_reports_widget,
-            self.category_settings_widget,
-            self.settings_widget
-        ]
+        """Load fresh data on a worker thread, then refresh all tabs from it"""
+        if self.refresh_running:
+            return
         
-        for widget in widgets:
+        self.refresh_running = True
+        self.statusBar().showMessage("Refreshing data...")
+        self.refresh_worker = RefreshWorker(self.db_manager)
+        self.refresh_worker.finished.connect(self.on_refresh_loaded)
+        start_worker_thread(self.refresh_worker, self.refresh_worker.finished)
+    
+    def on_refresh_loaded(self):
+        """Refresh data in all tabs"""
+        self.refresh_running = False
+        for widget in self.built_tabs():
             if hasattr(widget, 'refresh_data'):
                 widget.refresh_data()
             elif hasattr(widget, 'refresh_components'):
@@ -4463,6 +5022,9 @@ def main():
     app.setApplicationVersion("1.0")
     app.setOrganizationName("ELC Lab")
     
+    # Style the application
+    app.setStyleSheet(APP_STYLESHEET)
+    
     # Create and show main window
     window = ComponentManagerApp()
     window.show()
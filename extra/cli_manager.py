@@ -7,7 +7,12 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
+
+
+def write_lines(lines):
+    """Write lines to stdout with a single call"""
+    sys.stdout.write(''.join(f"{line}\n" for line in lines))
 
 
 def show_menu():
@@ -27,16 +32,15 @@ def view_components(db):
     components = db.get_components()
     print(f"\n{len(components)} Components:")
     print("-" * 60)
-    for comp in components:
-        print(f"ID: {comp[0]:<3} | {comp[1]:<15} | ${comp[3]:<6.2f} | {comp[2] or 'No description'}")
+    write_lines(f"ID: {comp[0]:<3} | {comp[1]:<15} | ${comp[3]:<6.2f} | {comp[2] or 'No description'}"
+                for comp in components)
 
 
 def view_categories(db):
     categories = db.get_categories()
     print(f"\n{len(categories)} Categories:")
     print("-" * 40)
-    for cat in categories:
-        print(f"ID: {cat[0]:<3} | {cat[1]:<15} | {cat[2] or 'No description'}")
+    write_lines(f"ID: {cat[0]:<3} | {cat[1]:<15} | {cat[2] or 'No description'}" for cat in categories)
 
 
 def add_component(db):
@@ -73,12 +77,13 @@ def link_component_category(db):
     print("\nLink Component to Category:")
     
     # Show available components
-    components = db.get_components()
+    components = db.get_components(limit=10)  # Show first 10
     print("\nAvailable Components:")
-    for comp in components[:10]:  # Show first 10
+    for comp in components:
         print(f"  {comp[0]}: {comp[1]}")
-    if len(components) > 10:
-        print(f"  ... and {len(components) - 10} more")
+    total = db.count_components()
+    if total > 10:
+        print(f"  ... and {total - 10} more")
     
     try:
         comp_id = int(input("Component ID: "))
@@ -115,8 +120,7 @@ def show_component_categories(db):
     categories = db.get_component_categories(comp_id)
     if categories:
         print(f"\nCategories for Component ID {comp_id}:")
-        for cat in categories:
-            print(f"  - {cat[1]}: {cat[2] or 'No description'}")
+        write_lines(f"  - {cat[1]}: {cat[2] or 'No description'}" for cat in categories)
     else:
         print(f"No categories found for Component ID {comp_id}")
 
@@ -131,14 +135,13 @@ def show_category_components(db):
     components = db.get_category_components(cat_id)
     if components:
         print(f"\nComponents for Category ID {cat_id}:")
-        for comp in components:
-            print(f"  - {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}")
+        write_lines(f"  - {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}" for comp in components)
     else:
         print(f"No components found for Category ID {cat_id}")
 
 
 def main():
-    db = DatabaseManager()
+    db = get_db()
     
     while True:
         show_menu()
@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def comprehensive_test():
     """Test all scenarios of the updated import logic"""
     print("=== Comprehensive Import Logic Test ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # First, add some test components to the database
     print("Setting up test data...")
@@ -25,11 +25,16 @@ def comprehensive_test():
         ("COMP-D", "", 3.0),  # No description
     ]
     
-    for identifier, desc, price in test_data:
-        # Check if exists first
-        existing = db.get_component_by_identifier(identifier)
-        if not existing:
-            db.insert_component(identifier, desc, price)
+    # Check what exists with one query, then insert the rest in one batch
+    existing = db.get_components_by_identifiers(row[0] for row in test_data)
+    missing = [row for row in test_data if row[0] not in existing]
+    if missing:
+        conn = db.get_connection()
+        with conn:
+            conn.executemany(
+                'INSERT INTO components (identifier, description, price) VALUES (?, ?, ?)', missing)
+        conn.close()
+        db.invalidate('components')
     
     # Create a test CSV with various scenarios
     csv_content = """ITEM,PRICE,DESCRIPTION
@@ -67,8 +72,10 @@ NEW-COMP-3,1.0,"""
     print("Final state:")
     test_components = ["COMP-A", "COMP-B", "COMP-C", "COMP-D", "NEW-COMP-1", "NEW-COMP-2", "NEW-COMP-3"]
     
+    final = db.get_components_by_identifiers(test_components)
+    
     for identifier in test_components:
-        comp = db.get_component_by_identifier(identifier)
+        comp = final.get(identifier)
         if comp:
             print(f"  {identifier}: ${comp[3]:.1f} - {comp[2] or 'No description'}")
     
@@ -5,6 +5,10 @@ import sqlite3
 conn = sqlite3.connect('components_users.db')
 cursor = conn.cursor()
 
+# use write-ahead logging (persistent in the file) and sync once per checkpoint
+cursor.execute('PRAGMA journal_mode=WAL')
+cursor.execute('PRAGMA synchronous=NORMAL')
+
 
 # create a sample table
 cursor.execute('''
@@ -51,6 +55,11 @@ CREATE TABLE IF NOT EXISTS students (
     )
 ''')
 
+# index identifier lookups and the category side of the link table
+# (component_id is already covered by the primary key)
+cursor.execute('CREATE INDEX IF NOT EXISTS idx_components_identifier ON components(identifier)')
+cursor.execute('CREATE INDEX IF NOT EXISTS idx_cc_cat ON component_category(category_id)')
+
 # commit changes and close the connection
 conn.commit()
 conn.close()
\ No newline at end of file
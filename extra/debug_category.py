@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 def debug_category_issue():
     """Debug the category update issue"""
@@ -16,41 +16,47 @@ def debug_category_issue():
     print("=" * 50)
     
     # Initialize database manager
-    db_manager = DatabaseManager()
+    db_manager = get_db()
     
     # Get a component to test
-    components = db_manager.get_components()
+    components = db_manager.get_components(limit=1)
     if components:
         test_component = components[0]
-        print("Component data structure:")
-        print(f"Raw data: {test_component}")
-        print(f"Length: {len(test_component)}")
+        print(f"Component data structure:\n"
+              f"Raw data: {test_component._asdict()}\n"
+              f"Length: {len(test_component)}")
         
-        # Try to unpack it correctly
+        # Read columns by name so the column order does not matter
         try:
-            component_id, identifier, description, price, created_at, updated_at, quantity, category = test_component
-            print(f"\nUnpacked correctly:")
-            print(f"ID: {component_id}")
-            print(f"Identifier: {identifier}")
-            print(f"Description: {description}")
-            print(f"Price: {price}")
-            print(f"Quantity: {quantity}")
-            print(f"Category: {category}")
-            print(f"Created: {created_at}")
-            print(f"Updated: {updated_at}")
-            
-            # Test the update method step by step
-            print(f"\nTesting update_component method...")
-            print(f"Current category: {category}")
+            component_id = test_component.id
+            identifier = test_component.identifier
+            description = test_component.description
+            price = test_component.price
+            quantity = test_component.quantity
+            category = test_component.category
+            created_at = test_component.created_at
+            updated_at = test_component.updated_at
             new_category = "TEST_CATEGORY"
             
-            print(f"Calling update_component with:")
-            print(f"  component_id: {component_id}")
-            print(f"  identifier: {identifier}")
-            print(f"  description: {description}")
-            print(f"  price: {price}")
-            print(f"  quantity: {quantity}")
-            print(f"  category: {new_category}")
+            # Test the update method step by step
+            print(f"\nUnpacked correctly:\n"
+                  f"ID: {component_id}\n"
+                  f"Identifier: {identifier}\n"
+                  f"Description: {description}\n"
+                  f"Price: {price}\n"
+                  f"Quantity: {quantity}\n"
+                  f"Category: {category}\n"
+                  f"Created: {created_at}\n"
+                  f"Updated: {updated_at}\n"
+                  f"\nTesting update_component method...\n"
+                  f"Current category: {category}\n"
+                  f"Calling update_component with:\n"
+                  f"  component_id: {component_id}\n"
+                  f"  identifier: {identifier}\n"
+                  f"  description: {description}\n"
+                  f"  price: {price}\n"
+                  f"  quantity: {quantity}\n"
+                  f"  category: {new_category}")
             
             # Update the component
             db_manager.update_component(
@@ -60,12 +66,11 @@ def debug_category_issue():
             # Check the result
             updated_component = db_manager.get_component_by_id(component_id)
             print(f"\nAfter update:")
-            print(f"Raw data: {updated_component}")
             
             if updated_component:
-                upd_id, upd_identifier, upd_description, upd_price, upd_created_at, upd_updated_at, upd_quantity, upd_category = updated_component
-                print(f"Updated category: {upd_category}")
-                print(f"Updated timestamp: {upd_updated_at}")
+                print(f"Raw data: {updated_component._asdict()}\n"
+                      f"Updated category: {updated_component.category}\n"
+                      f"Updated timestamp: {updated_component.updated_at}")
                 
                 # Restore original
                 db_manager.update_component(
@@ -74,7 +79,7 @@ def debug_category_issue():
                 print(f"Restored to original category: {category}")
             
         except Exception as e:
-            print(f"Error unpacking: {e}")
+            print(f"Error reading component: {e}")
     else:
         print("No components found in database")
 
@@ -7,75 +7,75 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
+
+
+# Feature overview printed ahead of the sample components
+FEATURES_BANNER = """\
+🎯 NEW INTERFACE FEATURES:
+==================================================
+1. 📊 IMPROVED LAYOUT
+   • Component form now at TOP of tab
+   • Components table below with MORE SPACE
+   • Better space utilization for data viewing
+
+2. 🔄 TABLE SORTING
+   • Click any column header to sort:
+     - ID (ascending/descending)
+     - Identifier (alphabetical)
+     - Description (alphabetical)
+     - Price (numerical)
+     - Updated date (chronological)
+
+3. 🖱️ CONTEXT MENU (Right-click)
+   • Right-click any component row for:
+     - ✏️  Edit Component (loads data into form)
+     - 🗑️  Delete Component (with confirmation)
+     - 🎨 Visual icons for better UX
+
+4. 🔘 SMART BUTTON BEHAVIOR
+   • Single button that adapts:
+     - 'Add Component' when form is empty
+     - 'Update Component' when editing existing
+   • Removed separate Update button for cleaner UI
+
+5. 📋 ENHANCED WORKFLOW
+   • Click table row → auto-fills form for editing
+   • Clear form → resets to add mode
+   • Context menu → quick actions without form
+
+🗃️ SAMPLE COMPONENTS (sortable by any column):
+----------------------------------------------------------------------
+ID   Identifier           Price      Description
+----------------------------------------------------------------------"""
 
 
 def demo_new_features():
     """Demonstrate the new interface features"""
     print("=== Component Manager - New Interface Features Demo ===\n")
     
-    db = DatabaseManager()
-    components = db.get_components()[:10]  # Show first 10 components
+    db = get_db()
+    components = db.get_components(limit=10)  # Show first 10 components
     
-    print("🎯 NEW INTERFACE FEATURES:")
-    print("=" * 50)
-    
-    print("1. 📊 IMPROVED LAYOUT")
-    print("   • Component form now at TOP of tab")
-    print("   • Components table below with MORE SPACE")
-    print("   • Better space utilization for data viewing")
-    print()
-    
-    print("2. 🔄 TABLE SORTING")
-    print("   • Click any column header to sort:")
-    print("     - ID (ascending/descending)")
-    print("     - Identifier (alphabetical)")
-    print("     - Description (alphabetical)")
-    print("     - Price (numerical)")
-    print("     - Updated date (chronological)")
-    print()
-    
-    print("3. 🖱️ CONTEXT MENU (Right-click)")
-    print("   • Right-click any component row for:")
-    print("     - ✏️  Edit Component (loads data into form)")
-    print("     - 🗑️  Delete Component (with confirmation)")
-    print("     - 🎨 Visual icons for better UX")
-    print()
-    
-    print("4. 🔘 SMART BUTTON BEHAVIOR")
-    print("   • Single button that adapts:")
-    print("     - 'Add Component' when form is empty")
-    print("     - 'Update Component' when editing existing")
-    print("   • Removed separate Update button for cleaner UI")
-    print()
-    
-    print("5. 📋 ENHANCED WORKFLOW")
-    print("   • Click table row → auto-fills form for editing")
-    print("   • Clear form → resets to add mode")
-    print("   • Context menu → quick actions without form")
-    print()
-    
-    print("🗃️ SAMPLE COMPONENTS (sortable by any column):")
-    print("-" * 70)
-    print(f"{'ID':<4} {'Identifier':<20} {'Price':<10} {'Description'}")
-    print("-" * 70)
+    print(FEATURES_BANNER)
     
+    rows = []
     for comp in components:
         comp_id = comp[0]
         identifier = comp[1]
         price = f"${comp[3]:.2f}"
         description = (comp[2] or 'No description')[:30] + ('...' if comp[2] and len(comp[2]) > 30 else '')
-        print(f"{comp_id:<4} {identifier:<20} {price:<10} {description}")
-    
-    print(f"\n📊 Total components in database: {len(db.get_components())}")
-    print("\n✨ To experience the new features:")
-    print("   1. Run: python component_manager.py")
-    print("   2. Go to Components tab")
-    print("   3. Try clicking column headers to sort")
-    print("   4. Right-click any component row")
-    print("   5. Click a row to edit, notice button changes")
+        rows.append(f"{comp_id:<4} {identifier:<20} {price:<10} {description}")
     
-    print("\n🎉 Interface update complete!")
+    print("".join(f"{row}\n" for row in rows) +
+          f"\n📊 Total components in database: {db.count_components()}\n"
+          "\n✨ To experience the new features:\n"
+          "   1. Run: python component_manager.py\n"
+          "   2. Go to Components tab\n"
+          "   3. Try clicking column headers to sort\n"
+          "   4. Right-click any component row\n"
+          "   5. Click a row to edit, notice button changes\n"
+          "\n🎉 Interface update complete!")
 
 
 if __name__ == '__main__':
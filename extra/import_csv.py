@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def import_components_csv(csv_file_path):
@@ -18,11 +18,11 @@ def import_components_csv(csv_file_path):
         print(f"❌ Error: CSV file not found: {csv_file_path}")
         return
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Get initial state
-    initial_components = db.get_components()
-    print(f"Initial components in database: {len(initial_components)}")
+    initial_count = db.count_components()
+    print(f"Initial components in database: {initial_count}")
     
     print(f"Importing from: {csv_file_path}")
     print("\nImport rules:")
@@ -45,9 +45,9 @@ def import_components_csv(csv_file_path):
             print(f"  ❌ Errors encountered: {results['errors']}")
         
         # Final state
-        final_components = db.get_components()
-        print(f"\nFinal components in database: {len(final_components)}")
-        print(f"Net increase: +{len(final_components) - len(initial_components)} components")
+        final_count = db.count_components()
+        print(f"\nFinal components in database: {final_count}")
+        print(f"Net increase: +{final_count - initial_count} components")
         
     except Exception as e:
         print(f"❌ Import failed: {e}")
@@ -5,14 +5,20 @@ Sample data script to populate the database with initial components and categori
 
 import sys
 import os
+from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def populate_sample_data():
     """Populate the database with sample electronic components and categories"""
-    db = DatabaseManager()
+    db = get_db()
+    now = datetime.now().isoformat()
+    
+    # Insert everything through one connection and commit once at the end
+    conn = db.get_connection()
+    cursor = conn.cursor()
     
     print("Adding sample categories...")
     
@@ -30,10 +36,15 @@ def populate_sample_data():
         ("POWER", "Power supplies and voltage regulators")
     ]
     
-    category_ids = {}
-    for name, desc in categories_data:
-        cat_id = db.insert_category(name, desc)
-        category_ids[name] = cat_id
+    cursor.execute('SELECT COALESCE(MAX(id), 0) FROM categories')
+    last_id = cursor.fetchone()[0]
+    cursor.executemany('INSERT INTO categories (name, description, updated_at) VALUES (?, ?, ?)',
+                       [(name, desc, now) for name, desc in categories_data])
+    
+    # Read back the ids assigned by the batch
+    cursor.execute('SELECT name, id FROM categories WHERE id > ? ORDER BY id', (last_id,))
+    category_ids = dict(cursor.fetchall())
+    for name, cat_id in category_ids.items():
         print(f"Added category: {name} (ID: {cat_id})")
     
     print("\nAdding sample components...")
@@ -57,10 +68,15 @@ def populate_sample_data():
         ("DIODE-1N4007", "1N4007 Rectifier Diode", 0.12)
     ]
     
-    component_ids = {}
-    for identifier, desc, price in components_data:
-        comp_id = db.insert_component(identifier, desc, price)
-        component_ids[identifier] = comp_id
+    cursor.execute('SELECT COALESCE(MAX(id), 0) FROM components')
+    last_id = cursor.fetchone()[0]
+    cursor.executemany('INSERT INTO components (identifier, description, price, updated_at) VALUES (?, ?, ?, ?)',
+                       [(identifier, desc, price, now) for identifier, desc, price in components_data])
+    
+    # Read back the ids assigned by the batch
+    cursor.execute('SELECT identifier, id FROM components WHERE id > ? ORDER BY id', (last_id,))
+    component_ids = dict(cursor.fetchall())
+    for identifier, comp_id in component_ids.items():
         print(f"Added component: {identifier} (ID: {comp_id})")
     
     print("\nCreating component-category links...")
@@ -86,12 +102,16 @@ def populate_sample_data():
         ("DIODE-1N4007", "DIODE")
     ]
     
-    for comp_name, cat_name in links:
-        if comp_name in component_ids and cat_name in category_ids:
-            comp_id = component_ids[comp_name]
-            cat_id = category_ids[cat_name]
-            db.link_component_category(comp_id, cat_id)
-            print(f"Linked {comp_name} to {cat_name}")
+    link_rows = [(comp_name, cat_name) for comp_name, cat_name in links
+                 if comp_name in component_ids and cat_name in category_ids]
+    cursor.executemany('INSERT OR IGNORE INTO component_category (component_id, category_id) VALUES (?, ?)',
+                       [(component_ids[comp_name], category_ids[cat_name]) for comp_name, cat_name in link_rows])
+    for comp_name, cat_name in link_rows:
+        print(f"Linked {comp_name} to {cat_name}")
+    
+    conn.commit()
+    conn.close()
+    db.invalidate('components')
     
     print("\nSample data populated successfully!")
     print(f"Added {len(categories_data)} categories")
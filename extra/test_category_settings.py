@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 def test_category_functionality():
     """Test the category settings functionality"""
@@ -16,7 +16,7 @@ def test_category_functionality():
     print("=" * 50)
     
     # Initialize database manager
-    db_manager = DatabaseManager()
+    db_manager = get_db()
     
     # Test 1: Check standard categories
     print("\n1. Current Standard Categories:")
@@ -25,7 +25,7 @@ def test_category_functionality():
     
     # Test 2: Get some sample components
     print("\n2. Sample Components and their Categories:")
-    components = db_manager.get_components()[:5]  # Get first 5 components
+    components = db_manager.get_components(limit=5)  # Get first 5 components
     
     if components:
         for component in components:
@@ -68,20 +68,21 @@ def test_category_functionality():
     
     # Test 4: Test adding a new custom category
     print("\n4. Testing custom category management:")
-    original_categories = db_manager.STANDARD_CATEGORIES.copy()
-    print(f"   Original category count: {len(original_categories)}")
+    # The standard categories are fixed, so manage a working set alongside them
+    custom_categories = set(db_manager.STANDARD_CATEGORIES_SET)
+    print(f"   Original category count: {len(custom_categories)}")
     
     # Add a test category
     test_category = "TEST_CATEGORY"
-    if test_category not in db_manager.STANDARD_CATEGORIES:
-        db_manager.STANDARD_CATEGORIES.append(test_category)
+    if test_category not in db_manager.STANDARD_CATEGORIES_SET:
+        custom_categories.add(test_category)
         print(f"   Added test category: {test_category}")
-        print(f"   New category count: {len(db_manager.STANDARD_CATEGORIES)}")
+        print(f"   New category count: {len(custom_categories)}")
         
         # Remove the test category
-        db_manager.STANDARD_CATEGORIES.remove(test_category)
+        custom_categories.discard(test_category)
         print(f"   Removed test category: {test_category}")
-        print(f"   Final category count: {len(db_manager.STANDARD_CATEGORIES)}")
+        print(f"   Final category count: {len(custom_categories)}")
     
     print("\n" + "=" * 50)
     print("Category Settings functionality test completed!")
@@ -7,18 +7,18 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def test_csv_import():
     """Test the CSV import functionality"""
     print("=== Testing CSV Import ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Get initial count
-    initial_components = db.get_components()
-    print(f"Initial components count: {len(initial_components)}")
+    initial_count = db.count_components()
+    print(f"Initial components count: {initial_count}")
     
     # Test import
     csv_file_path = "/home/dino/Python/ELC_LAB/imports/components.csv"
@@ -33,14 +33,15 @@ def test_csv_import():
         print(f"• Errors encountered: {results['errors']}")
         
         # Get final count
-        final_components = db.get_components()
-        print(f"\nFinal components count: {len(final_components)}")
-        print(f"Net increase: {len(final_components) - len(initial_components)}")
+        final_count = db.count_components()
+        print(f"\nFinal components count: {final_count}")
+        print(f"Net increase: {final_count - initial_count}")
         
         # Show some examples of imported components
         print(f"\nSample of imported/updated components:")
-        for i, comp in enumerate(final_components[-10:]):  # Last 10 components
-            print(f"  {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}")
+        last_components = db.get_components(limit=10, offset=max(final_count - 10, 0))
+        sys.stdout.write(''.join(f"  {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}\n"
+                                 for comp in last_components))  # Last 10 components
         
         print("\n✅ CSV Import test completed successfully!")
         
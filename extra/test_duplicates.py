@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def test_duplicate_handling():
     """Test how duplicates are handled during import"""
     print("=== Testing Duplicate Handling ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Check some specific components that should have been updated
     test_components = [
@@ -27,21 +27,18 @@ def test_duplicate_handling():
     
     print("Checking how duplicates were handled:\n")
     
-    for identifier in test_components:
-        component = db.get_component_by_identifier(identifier)
-        if component:
-            print(f"{identifier}:")
-            print(f"  Current price: ${component[3]:.2f}")
-            print(f"  Description: {component[2] or 'No description'}")
-            print()
+    found = db.get_components_by_identifiers(test_components)
+    sys.stdout.write(''.join(f"{identifier}:\n"
+                             f"  Current price: ${found[identifier][3]:.2f}\n"
+                             f"  Description: {found[identifier][2] or 'No description'}\n\n"
+                             for identifier in test_components if identifier in found))
     
     # Show all LM317 variations to see how similar components were handled
     print("Looking for LM317 variations:")
-    all_components = db.get_components()
-    lm317_components = [comp for comp in all_components if 'LM317' in comp[1].upper()]
+    lm317_components = db.find_components_by_identifier_substring('LM317')
     
-    for comp in lm317_components:
-        print(f"  {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}")
+    sys.stdout.write(''.join(f"  {comp[1]}: ${comp[3]:.2f} - {comp[2] or 'No description'}\n"
+                             for comp in lm317_components))
 
 
 if __name__ == '__main__':
@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 def test_new_interface():
     """Test the new category settings interface functionality"""
@@ -16,25 +16,24 @@ def test_new_interface():
     print("=" * 60)
     
     # Initialize database manager
-    db_manager = DatabaseManager()
+    db_manager = get_db()
     
     # Test 1: Display components that would appear in the list
     print("\n1. Components that will appear in the component list:")
-    components = db_manager.get_components()[:10]  # First 10 components
+    components = db_manager.get_components(limit=10)  # First 10 components
     
     if components:
-        print(f"   Found {len(db_manager.get_components())} total components")
+        print(f"   Found {db_manager.count_components()} total components")
         print("   Sample components:")
         
         for i, component in enumerate(components, 1):
-            component_id, identifier, description, price, created_at, updated_at, quantity, category = component
-            display_text = f"{identifier or 'No ID'} - {description or 'No description'}"
-            if category:
-                display_text += f" [{category}]"
+            display_text = f"{component.identifier or 'No ID'} - {component.description or 'No description'}"
+            if component.category:
+                display_text += f" [{component.category}]"
             else:
                 display_text += " [No Category]"
             
-            print(f"   {i}. ID: {component_id} | {display_text}")
+            print(f"   {i}. ID: {component.id} | {display_text}")
     else:
         print("   No components found in database")
     
@@ -46,18 +45,14 @@ def test_new_interface():
     # Test 3: Simulate selecting a component and changing its category
     if components:
         test_component = components[0]
-        component_id, identifier, description, price, created_at, updated_at, quantity, current_category = test_component
+        component_id, identifier, description, price, quantity, current_category = test_component[:6]
         
         print(f"\n3. Test category change simulation:")
         print(f"   Selected Component: {identifier} (ID: {component_id})")
         print(f"   Current Category: {current_category or 'Not set'}")
         
         # Find a different category to test with
-        new_category = None
-        for cat in db_manager.STANDARD_CATEGORIES:
-            if cat != current_category:
-                new_category = cat
-                break
+        new_category = next((cat for cat in db_manager.STANDARD_CATEGORIES if cat != current_category), None)
         
         if new_category:
             print(f"   Simulated Radio Selection: {new_category}")
@@ -74,7 +69,7 @@ def test_new_interface():
                 # Verify the update
                 updated_component = db_manager.get_component_by_id(component_id)
                 if updated_component:
-                    _, _, _, _, _, _, _, actual_category = updated_component
+                    actual_category = updated_component.category
                     print(f"   Update successful! New category: {actual_category}")
                     
                     # Restore original category
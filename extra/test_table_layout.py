@@ -7,15 +7,19 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
+
+
+# Row layout of the sample table, shared by the header and every component row
+ROW_FORMAT = "{:<4} {:<20} {:<25} {:<8}".format
 
 
 def test_table_layout():
     """Test the updated table layout without the Updated column"""
     print("=== Testing Updated Table Layout ===\n")
     
-    db = DatabaseManager()
-    components = db.get_components()[:5]  # Get first 5 components
+    db = get_db()
+    components = db.get_component_columns('id', 'identifier', 'description', 'price', limit=5)  # First 5 components
     
     print("✅ Updated Components Table Layout:")
     print("   • Removed 'Updated' column")
@@ -25,16 +29,12 @@ def test_table_layout():
     
     print("📊 Sample Components Display:")
     print("-" * 65)
-    print(f"{'ID':<4} {'Identifier':<20} {'Description':<25} {'Price':<8}")
+    print(ROW_FORMAT('ID', 'Identifier', 'Description', 'Price'))
     print("-" * 65)
     
-    for comp in components:
-        comp_id = str(comp[0])
-        identifier = comp[1][:19]  # Truncate if too long
-        description = (comp[2] or 'No description')[:24]  # Truncate if too long
-        price = f"${comp[3]:.2f}"
-        
-        print(f"{comp_id:<4} {identifier:<20} {description:<25} {price:<8}")
+    # Truncate identifier and description if too long
+    for comp_id, identifier, description, price in components:
+        print(ROW_FORMAT(str(comp_id), identifier[:19], (description or 'No description')[:24], f"${price:.2f}"))
     
     print(f"\n📈 Column Resize Behavior:")
     print("   • ID: Fits content (auto-size)")
@@ -7,19 +7,18 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def test_updated_interface():
     """Test the database operations to ensure the interface changes work correctly"""
     print("=== Testing Updated Components Interface ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Test basic functionality
     print("1. Testing database connectivity...")
-    components = db.get_components()
-    print(f"   ✅ Found {len(components)} components in database")
+    print(f"   ✅ Found {db.count_components()} components in database")
     
     # Test adding a component
     print("\n2. Testing component addition...")
@@ -38,8 +37,20 @@ def test_updated_interface():
     else:
         print("   ❌ Update verification failed")
     
+    # Test bulk addition
+    print("\n4. Testing bulk component addition...")
+    bulk_rows = [(f"TEST-UI-BULK-{i}", "Bulk test component", 1.0 + i) for i in range(3)]
+    inserted = db.insert_components_bulk(bulk_rows)
+    bulk_comps = db.get_components_by_identifiers(row[0] for row in bulk_rows)
+    if inserted == len(bulk_rows) and len(bulk_comps) == len(bulk_rows):
+        print(f"   ✅ Bulk-added {inserted} test components")
+    else:
+        print("   ❌ Bulk addition failed")
+    for comp in bulk_comps.values():
+        db.delete_component(comp[0])
+    
     # Test deletion
-    print("\n4. Testing component deletion...")
+    print("\n5. Testing component deletion...")
     db.delete_component(test_id)
     deleted_comp = db.get_component_by_identifier("TEST-UI-COMP")
     if deleted_comp is None:
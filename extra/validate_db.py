@@ -7,28 +7,27 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def validate_database():
     """Validate that the database is working correctly"""
     print("=== Database Validation ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Test components
     print("Components in database:")
-    components = db.get_components()
-    for comp in components:
-        print(f"  ID: {comp[0]}, Identifier: {comp[1]}, Price: ${comp[3]:.2f}")
+    components = db.get_component_columns('id', 'identifier', 'price')
+    sys.stdout.write(''.join(f"  ID: {comp_id}, Identifier: {identifier}, Price: ${price:.2f}\n"
+                             for comp_id, identifier, price in components))
     
     print(f"\nTotal components: {len(components)}")
     
     # Test categories
     print("\nCategories in database:")
     categories = db.get_categories()
-    for cat in categories:
-        print(f"  ID: {cat[0]}, Name: {cat[1]}")
+    sys.stdout.write(''.join(f"  ID: {cat[0]}, Name: {cat[1]}\n" for cat in categories))
     
     print(f"\nTotal categories: {len(categories)}")
     
@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from component_manager import DatabaseManager
+from component_manager import get_db
 
 
 def verify_import():
     """Verify that the new import logic works correctly"""
     print("=== Verifying Updated Import Logic ===\n")
     
-    db = DatabaseManager()
+    db = get_db()
     
     # Check the test components we just imported
     test_components = [
@@ -27,15 +27,17 @@ def verify_import():
     
     print("Checking imported/updated components:\n")
     
+    found = db.get_components_by_identifiers(test_components)
+    lines = []
     for identifier in test_components:
-        component = db.get_component_by_identifier(identifier)
+        component = found.get(identifier)
         if component:
-            print(f"✅ {identifier}:")
-            print(f"    Price: ${component[3]:.2f}")
-            print(f"    Description: {component[2] or 'No description'}")
-            print()
+            lines.append(f"✅ {identifier}:\n"
+                         f"    Price: ${component[3]:.2f}\n"
+                         f"    Description: {component[2] or 'No description'}\n\n")
         else:
-            print(f"❌ {identifier}: Not found")
+            lines.append(f"❌ {identifier}: Not found\n")
+    sys.stdout.write(''.join(lines))
     
     print("=== Verification Complete ===")
     print("✅ All components imported correctly, including those without descriptions!")